@@ -1,27 +1,69 @@
 import logging
+import time
+
+from src.models.robot import Robot
+
+# Robot statuses bound once at module level for the per-robot loops
+_IDLE = Robot.STATUS_IDLE
+_MOVING = Robot.STATUS_MOVING
+_WAITING = Robot.STATUS_WAITING
+_CHARGING = Robot.STATUS_CHARGING
+_COMPLETED = Robot.STATUS_COMPLETED
 
 class FleetManager:
+    # Maps each Robot.STATUS_* value to its key in get_robot_status_count()
+    STATUS_KEYS = {
+        _IDLE: "idle",
+        _MOVING: "moving",
+        _WAITING: "waiting",
+        _CHARGING: "charging",
+        _COMPLETED: "task_complete"
+    }
+    
     def __init__(self, nav_graph, traffic_manager, logger=None):
         self.robots = {}  # Dictionary of robot_id: Robot object
+        self._robots_by_vertex = {}  # Dictionary of vertex_index: {robot_id: Robot object}
+        
+        # Robots that still have work to do. Parked robots (see Robot.is_parked)
+        # only keep their vertex registered until a new task or status change
+        # wakes them up again
+        self._active_ids = set()
+        # Cached (robot, parked vertex) per robot in fleet order, None when stale.
+        # The vertex is None for active robots
+        self._schedule = ()
         self.nav_graph = nav_graph
         self.traffic_manager = traffic_manager
         self.next_robot_id = 0
         self.logger = logger or logging.getLogger(__name__)
+        
+        # Robot counts per status key, kept up to date by Robot.set_status.
+        # Read-only for everyone else, see get_robot_status_count for a copy
+        self.status_counts = {key: 0 for key in self.STATUS_KEYS.values()}
+        
+        # Set whenever robots or reservations may have changed, cleared by
+        # the GUI once it has redrawn
+        self.dirty = True
+        
+        # IDs of the robots that may have changed since the last take_dirty_robots() call
+        self.dirty_robots = set()
     
     def spawn_robot(self, vertex_index):
         """Spawn a new robot at the specified vertex"""
-        from src.models.robot import Robot
-        
         # Check if the vertex exists
         if vertex_index not in self.nav_graph.vertex_map:
-            self.logger.error(f"Cannot spawn robot at invalid vertex {vertex_index}")
+            self.logger.error("Cannot spawn robot at invalid vertex %s", vertex_index)
             return None
         
         # Create the robot
-        robot = Robot(self.next_robot_id, vertex_index, self.nav_graph, self.logger)
+        robot = Robot(self.next_robot_id, vertex_index, self.nav_graph, self.logger,
+                      on_status_change=self._on_status_change,
+                      on_vertex_change=self._on_vertex_change)
         self.robots[self.next_robot_id] = robot
+        self._robots_by_vertex.setdefault(vertex_index, {})[robot.id] = robot
+        self.status_counts[self.STATUS_KEYS[robot.status]] += 1
+        self._wake(robot)
         
-        self.logger.info(f"Spawned Robot {self.next_robot_id} at vertex {vertex_index} ({self.nav_graph.get_vertex_name(vertex_index)})")
+        self.logger.info("Spawned Robot %s at vertex %s (%s)", self.next_robot_id, vertex_index, self.nav_graph.get_vertex_name(vertex_index))
         
         # Increment robot ID for next spawn
         self.next_robot_id += 1
@@ -31,59 +73,104 @@ class FleetManager:
     def assign_task(self, robot_id, destination_vertex):
         """Assign a navigation task to a robot"""
         if robot_id not in self.robots:
-            self.logger.error(f"Cannot assign task to non-existent robot {robot_id}")
+            self.logger.error("Cannot assign task to non-existent robot %s", robot_id)
             return False
         
         if destination_vertex not in self.nav_graph.vertex_map:
-            self.logger.error(f"Cannot assign task with invalid destination vertex {destination_vertex}")
+            self.logger.error("Cannot assign task with invalid destination vertex %s", destination_vertex)
             return False
         
         robot = self.robots[robot_id]
         success = robot.set_destination(destination_vertex)
+        self._wake(robot)
         
         if success:
-            self.logger.info(f"Assigned Robot {robot_id} to navigate to vertex {destination_vertex} ({self.nav_graph.get_vertex_name(destination_vertex)})")
-            self.logger.info(f"Path calculated: {robot.path}")
+            # The vertex name and path list are only built if they are logged
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Assigned Robot %s to navigate to vertex %s (%s)", robot_id, destination_vertex, self.nav_graph.get_vertex_name(destination_vertex))
+                self.logger.info("Path calculated: %s", list(robot.path))
         else:
-            self.logger.warning(f"Failed to assign Robot {robot_id} to navigate to vertex {destination_vertex}")
+            self.logger.warning("Failed to assign Robot %s to navigate to vertex %s", robot_id, destination_vertex)
         
         return success
     
-    def update(self, dt=None):
-        """Update all robots"""
-        for robot_id, robot in self.robots.items():
-            robot.update(self.traffic_manager, dt)
+    def update(self, dt=None, now=None):
+        """Update all robots that have something to do"""
+        # One clock reading is shared by every robot in this tick
+        if now is None:
+            now = time.monotonic()
         
+        schedule = self._schedule
+        if schedule is None:
+            self._rebuild_schedule()
+            schedule = self._schedule
+        
+        # Only active robots move or change reservations, parked robots
+        # leave everything as it was
+        if self._active_ids:
+            self.dirty = True
+            self.dirty_robots.update(self._active_ids)
+        
+        # Robots are stepped in fleet order and parked robots just hold on to
+        # their vertex, so a vertex released by a robot passing through is
+        # claimed back before the robots after it look at it
+        traffic_manager = self.traffic_manager
+        occupy_vertex = traffic_manager.occupy_vertex
+        for robot, parked_vertex in schedule:
+            if parked_vertex is not None:
+                occupy_vertex(robot.id, parked_vertex)
+                continue
+            robot.update(traffic_manager, dt, now)
+            if robot.is_parked():
+                self._active_ids.discard(robot.id)
+                self._schedule = None
+    
+    def _rebuild_schedule(self):
+        """Pair every robot with its parked vertex, or None if it is active"""
+        active_ids = self._active_ids
+        self._schedule = tuple(
+            (robot, None if robot.id in active_ids else robot.current_vertex)
+            for robot in self.robots.values())
+    
+    def _wake(self, robot):
+        """Make sure a robot is stepped by update() again"""
+        self.dirty = True
+        self.dirty_robots.add(robot.id)
+        if robot.id not in self._active_ids:
+            self._active_ids.add(robot.id)
+            self._schedule = None
     
-        self.get_robot_status_count()
+    def take_dirty_robots(self):
+        """Get the IDs of the robots that may have changed since the last call"""
+        dirty_robots = self.dirty_robots
+        self.dirty_robots = set()
+        return dirty_robots
     
     def get_robot_at_vertex(self, vertex_index):
         """Get the first robot found at the specified vertex"""
-        for robot in self.robots.values():
-            if robot.current_vertex == vertex_index and robot.status != robot.STATUS_MOVING:
+        for robot in self._robots_by_vertex.get(vertex_index, {}).values():
+            if robot.status != _MOVING:
                 return robot
         return None
     
+    def _on_vertex_change(self, robot, old_vertex, new_vertex):
+        """Keep the vertex index in sync when a robot reaches a new vertex"""
+        robots_at_old = self._robots_by_vertex[old_vertex]
+        del robots_at_old[robot.id]
+        if not robots_at_old:
+            del self._robots_by_vertex[old_vertex]
+        self._robots_by_vertex.setdefault(new_vertex, {})[robot.id] = robot
+    
+    def _on_status_change(self, robot, old_status, new_status):
+        """Keep the status counts in sync when a robot changes status"""
+        self._wake(robot)
+        counts = self.status_counts
+        status_keys = self.STATUS_KEYS
+        if old_status in status_keys:
+            counts[status_keys[old_status]] -= 1
+        if new_status in status_keys:
+            counts[status_keys[new_status]] += 1
+    
     def get_robot_status_count(self):
         """Count robots in each status"""
-        counts = {
-            "idle": 0,
-            "moving": 0,
-            "waiting": 0,
-            "charging": 0,
-            "task_complete": 0
-        }
-        
-        for robot in self.robots.values():
-            if robot.status == robot.STATUS_IDLE:
-                counts["idle"] += 1
-            elif robot.status == robot.STATUS_MOVING:
-                counts["moving"] += 1
-            elif robot.status == robot.STATUS_WAITING:
-                counts["waiting"] += 1
-            elif robot.status == robot.STATUS_CHARGING:
-                counts["charging"] += 1
-            elif robot.status == robot.STATUS_COMPLETED:
-                counts["task_complete"] += 1
-        
-        return counts
\ No newline at end of file
+        return self.status_counts.copy()
@@ -1,24 +1,128 @@
+import logging
+from bisect import bisect_left, insort
+from collections import deque
 
+class OrderedUniqueQueue:
+    """
+    FIFO queue of unique items with O(1) membership and position lookups.
+    Positions are stored as sequence numbers relative to a head offset, so
+    dequeuing from the front never has to renumber the remaining items.
+    Items removed from the middle leave a gap in the sequence numbers that
+    position() skips over.
+    """
+    __slots__ = ("_items", "_seq", "_gaps", "_head", "_tail")
 
-import logging
-from collections import defaultdict
+    def __init__(self):
+        self._items = deque()  # Queued items, including removed ones not yet reached by the head
+        self._seq = {}  # Format: {item: sequence number}
+        self._gaps = []  # Sorted sequence numbers of items removed from the middle
+        self._head = 0  # Sequence number of the item at the front
+        self._tail = 0  # Sequence number given to the next pushed item
+
+    def push(self, item):
+        """Append item to the back, returns False if it was already queued"""
+        if item in self._seq:
+            return False
+        self._seq[item] = self._tail
+        self._tail += 1
+        self._items.append(item)
+        return True
+
+    def popleft(self):
+        """Remove and return the item at the front"""
+        item = self._items.popleft()
+        del self._seq[item]
+        self._head += 1
+        # Drop removed items that have reached the front
+        gaps = self._gaps
+        while gaps and gaps[0] == self._head:
+            self._items.popleft()
+            del gaps[0]
+            self._head += 1
+        return item
+
+    def remove(self, item):
+        """Remove item wherever it is in the queue, returns False if absent"""
+        seq = self._seq.get(item)
+        if seq is None:
+            return False
+        if seq == self._head:
+            self.popleft()
+            return True
+        # Removing from the middle: leave the item's slot as a gap
+        del self._seq[item]
+        insort(self._gaps, seq)
+        return True
+
+    def peek(self):
+        """Return the item at the front without removing it"""
+        return self._items[0] if self._seq else None
+
+    def position(self, item):
+        """Get the 1-based position of item, or 0 if it is not queued"""
+        seq = self._seq.get(item)
+        if seq is None:
+            return 0
+        return seq - self._head + 1 - bisect_left(self._gaps, seq)
+
+    def __contains__(self, item):
+        return item in self._seq
+
+    def __len__(self):
+        return len(self._seq)
+
+    def __iter__(self):
+        if not self._gaps:
+            return iter(self._items)
+        gaps = set(self._gaps)
+        return (item for seq, item in enumerate(self._items, self._head) if seq not in gaps)
+
+# Lanes are keyed by a single packed int, (from_vertex << LANE_KEY_SHIFT) | to_vertex,
+# which hashes faster than a (from_vertex, to_vertex) tuple and needs no tuple allocation
+LANE_KEY_SHIFT = 32
+LANE_KEY_MASK = (1 << LANE_KEY_SHIFT) - 1
+
+class LaneState:
+    """Reservation state of a single lane"""
+    __slots__ = ("occupant", "queue")
+
+    def __init__(self):
+        self.occupant = None  # ID of the robot holding the lane
+        self.queue = None  # OrderedUniqueQueue of robots waiting for the lane, created on demand
+
+class VertexState:
+    """Reservation state of a single vertex"""
+    __slots__ = ("occupant", "queue", "waiting")
+
+    def __init__(self):
+        self.occupant = None  # ID of the robot at the vertex
+        self.queue = None  # OrderedUniqueQueue of robots waiting to enter the vertex
+        self.waiting = None  # OrderedUniqueQueue of robots at the vertex waiting for a lane
 
 class TrafficManager:
     def __init__(self, logger=None):
-        # Track which lanes are occupied and by which robots
-        self.occupied_lanes = {}  # Format: {(from_vertex, to_vertex): robot_id}
+        # The state dicts below only hold records that are in use (occupied or
+        # with robots queued); idle records are deleted, so a missing key
+        # means a free lane/vertex and readers must use .get()
+        
+        # Occupant and queue of every lane in use
+        self.lanes = {}  # Format: {lane_key: LaneState}
         
-        # Queue of robots waiting for each lane
-        self.lane_queues = defaultdict(list)  # Format: {(from_vertex, to_vertex): [robot_id1, robot_id2, ...]}
+        # Occupant, entry queue and waiting robots of every vertex in use
+        self.vertices = {}  # Format: {vertex_id: VertexState}
         
-        # Track robots waiting at vertices
-        self.waiting_at_vertex = defaultdict(list)  # Format: {vertex_id: [robot_id1, robot_id2, ...]}
+        # Reverse index of the lane each queued robot is waiting for
+        self.queued_lane = {}  # Format: {robot_id: lane_key}
         
-        # Track which robots are occupying which vertices
-        self.occupied_vertices = {}  # Format: {vertex_id: robot_id}
+        # Lanes and vertices whose occupant, queue or waiting robots changed
+        # since the last take_dirty() call
+        self.dirty_lanes = set()  # Format: {lane_key}
+        self.dirty_vertices = set()  # Format: {vertex_id}
         
-        # Queue of robots waiting for each vertex
-        self.vertex_queues = defaultdict(list)  # Format: {vertex_id: [robot_id1, robot_id2, ...]}
+        # Bumped whenever a vertex gets a new occupant or is released, so a
+        # robot that registered at a vertex and sees the same count still
+        # holds it
+        self.vertex_occupancy_changes = 0
         
         self.logger = logger or logging.getLogger(__name__)
     
@@ -27,143 +131,219 @@ class TrafficManager:
         Check if lane is available and the destination vertex is free,
         and reserve them if they are, otherwise queue the robot
         """
-        lane_key = (from_vertex, to_vertex)
+        lane_key = (from_vertex << LANE_KEY_SHIFT) | to_vertex
+        robot_id = robot.id
+        lane = self.lanes.get(lane_key)
+        vertex = self.vertices.get(to_vertex)
+        occupying_robot = lane.occupant if lane is not None else None
+        vertex_robot = vertex.occupant if vertex is not None else None
         
-        # First check if the destination vertex is occupied by another robot
-        vertex_occupied = False
-        if to_vertex in self.occupied_vertices and self.occupied_vertices[to_vertex] != robot.id:
-            # Vertex is occupied by another robot
-            vertex_occupied = True
-            if robot.id not in self.vertex_queues[to_vertex]:
-                self.vertex_queues[to_vertex].append(robot.id)
-                self.logger.info(f"Vertex {to_vertex} is occupied by Robot {self.occupied_vertices[to_vertex]}. Robot {robot.id} queued.")
+        # Common case first: lane is free and the destination vertex is not
+        # occupied by another robot, so reserve the lane
+        if occupying_robot is None and (vertex_robot is None or vertex_robot == robot_id):
+            if lane is None:
+                lane = self.lanes[lane_key] = LaneState()
+            lane.occupant = robot_id
+            self.dirty_lanes.add(lane_key)
+            
+            # Remove from waiting lists if present. The robot being granted access
+            # is normally at the front of its queues, so this is a popleft()
+            queued_lane = self.queued_lane.pop(robot_id, None)
+            if queued_lane is not None:
+                self._dequeue_from_lane(robot_id, queued_lane)
+            if vertex is not None and vertex.queue:
+                if vertex.queue.remove(robot_id):
+                    self.dirty_vertices.add(to_vertex)
+                self._prune_vertex(to_vertex, vertex)
+                
+            self.logger.info("Lane from %s to %s reserved by Robot %s", from_vertex, to_vertex, robot_id)
+            return True
         
-        # Then check if the lane is occupied
-        lane_occupied = False
-        if lane_key in self.occupied_lanes:
-            # Lane is occupied, add robot to queue
-            lane_occupied = True
-            if robot.id not in self.lane_queues[lane_key]:
-                self.lane_queues[lane_key].append(robot.id)
+        # Otherwise the robot must wait. Queue it for the destination vertex
+        # if another robot is occupying it
+        if vertex_robot is not None and vertex_robot != robot_id:
+            if vertex.queue is None:
+                vertex.queue = OrderedUniqueQueue()
+            if vertex.queue.push(robot_id):
+                self.dirty_vertices.add(to_vertex)
+                self.logger.info("Vertex %s is occupied by Robot %s. Robot %s queued.", to_vertex, vertex_robot, robot_id)
+        
+        # And queue it for the lane if the lane is occupied
+        if occupying_robot is not None:
+            if lane.queue is None:
+                lane.queue = OrderedUniqueQueue()
+            if lane.queue.push(robot_id):
+                self.dirty_lanes.add(lane_key)
+                # A robot only waits for one lane at a time; drop it from the
+                # queue of the lane it was waiting for before re-planning
+                previous_lane = self.queued_lane.get(robot_id)
+                if previous_lane is not None:
+                    self._dequeue_from_lane(robot_id, previous_lane)
+                self.queued_lane[robot_id] = lane_key
                 
                 # Add to waiting at vertex list
-                if robot.id not in self.waiting_at_vertex[from_vertex]:
-                    self.waiting_at_vertex[from_vertex].append(robot.id)
+                start = self._vertex_state(from_vertex)
+                if start.waiting is None:
+                    start.waiting = OrderedUniqueQueue()
+                if start.waiting.push(robot_id):
+                    self.dirty_vertices.add(from_vertex)
                 
-                occupying_robot = self.occupied_lanes[lane_key]
-                self.logger.info(f"Lane from {from_vertex} to {to_vertex} is occupied by Robot {occupying_robot}. Robot {robot.id} queued.")
-        
-        # If either lane or destination vertex is occupied, robot must wait
-        if lane_occupied or vertex_occupied:
-            return False
-        
-        # Both lane and vertex are free, reserve them
-        self.occupied_lanes[lane_key] = robot.id
+                self.logger.info("Lane from %s to %s is occupied by Robot %s. Robot %s queued.", from_vertex, to_vertex, occupying_robot, robot_id)
         
-        # Remove from waiting lists if present
-        if robot.id in self.lane_queues[lane_key]:
-            self.lane_queues[lane_key].remove(robot.id)
-        
-        if robot.id in self.waiting_at_vertex[from_vertex]:
-            self.waiting_at_vertex[from_vertex].remove(robot.id)
-            
-        self.logger.info(f"Lane from {from_vertex} to {to_vertex} reserved by Robot {robot.id}")
-        return True
+        return False
+    
+    def _vertex_state(self, vertex_id):
+        """Get the state of a vertex, creating it if needed"""
+        vertex = self.vertices.get(vertex_id)
+        if vertex is None:
+            vertex = self.vertices[vertex_id] = VertexState()
+        return vertex
+    
+    def _dequeue_from_lane(self, robot_id, lane_key):
+        """Remove a robot from a lane queue and from the waiting list of the lane's start vertex"""
+        lane = self.lanes.get(lane_key)
+        if lane is not None and lane.queue:
+            if lane.queue.remove(robot_id):
+                self.dirty_lanes.add(lane_key)
+            self._prune_lane(lane_key, lane)
+        start_vertex = lane_key >> LANE_KEY_SHIFT
+        start = self.vertices.get(start_vertex)
+        if start is not None and start.waiting:
+            if start.waiting.remove(robot_id):
+                self.dirty_vertices.add(start_vertex)
+            self._prune_vertex(start_vertex, start)
+    
+    def _prune_lane(self, lane_key, lane):
+        """Forget a lane that is neither occupied nor has robots queued"""
+        if lane.occupant is None and not lane.queue:
+            del self.lanes[lane_key]
+    
+    def _prune_vertex(self, vertex_id, vertex):
+        """Forget a vertex that is neither occupied nor has robots queued or waiting"""
+        if vertex.occupant is None and not vertex.queue and not vertex.waiting:
+            del self.vertices[vertex_id]
     
     def release_lane(self, from_vertex, to_vertex):
         """Release a lane reservation and notify next robot in queue if any"""
-        lane_key = (from_vertex, to_vertex)
-        if lane_key in self.occupied_lanes:
-            robot_id = self.occupied_lanes[lane_key]
-            del self.occupied_lanes[lane_key]
-            self.logger.info(f"Lane from {from_vertex} to {to_vertex} released by Robot {robot_id}")
+        lane_key = (from_vertex << LANE_KEY_SHIFT) | to_vertex
+        lane = self.lanes.get(lane_key)
+        if lane is not None and lane.occupant is not None:
+            robot_id = lane.occupant
+            lane.occupant = None
+            self.dirty_lanes.add(lane_key)
+            self.logger.info("Lane from %s to %s released by Robot %s", from_vertex, to_vertex, robot_id)
             
             # Check if there are robots waiting for this lane
-            if self.lane_queues[lane_key]:
-                next_robot_id = self.lane_queues[lane_key][0]
-                self.logger.info(f"Notifying Robot {next_robot_id} that lane from {from_vertex} to {to_vertex} is now available")
+            if lane.queue:
+                next_robot_id = lane.queue.peek()
+                self.logger.info("Notifying Robot %s that lane from %s to %s is now available", next_robot_id, from_vertex, to_vertex)
                 return True, next_robot_id
+            del self.lanes[lane_key]
             return True, None
         return False, None
     
     def occupy_vertex(self, robot_id, vertex_id):
         """Mark a vertex as occupied by a robot"""
+        vertex = self._vertex_state(vertex_id)
+        
         # If the vertex was already occupied by this robot, no change
-        if vertex_id in self.occupied_vertices and self.occupied_vertices[vertex_id] == robot_id:
+        if vertex.occupant == robot_id:
             return
             
         # Otherwise, mark it as occupied and log
-        self.occupied_vertices[vertex_id] = robot_id
-        self.logger.info(f"Vertex {vertex_id} occupied by Robot {robot_id}")
+        vertex.occupant = robot_id
+        self.vertex_occupancy_changes += 1
+        self.dirty_vertices.add(vertex_id)
+        self.logger.info("Vertex %s occupied by Robot %s", vertex_id, robot_id)
         
     def release_vertex(self, vertex_id):
         """Release a vertex and notify waiting robots if any"""
-        if vertex_id in self.occupied_vertices:
-            robot_id = self.occupied_vertices[vertex_id]
-            del self.occupied_vertices[vertex_id]
-            self.logger.info(f"Vertex {vertex_id} released by Robot {robot_id}")
+        vertex = self.vertices.get(vertex_id)
+        if vertex is not None and vertex.occupant is not None:
+            robot_id = vertex.occupant
+            vertex.occupant = None
+            self.vertex_occupancy_changes += 1
+            self.dirty_vertices.add(vertex_id)
+            self.logger.info("Vertex %s released by Robot %s", vertex_id, robot_id)
             
             # Check if there are robots waiting for this vertex
-            if self.vertex_queues[vertex_id]:
-                next_robot_id = self.vertex_queues[vertex_id][0]
-                self.logger.info(f"Notifying Robot {next_robot_id} that vertex {vertex_id} is now available")
+            if vertex.queue:
+                next_robot_id = vertex.queue.peek()
+                self.logger.info("Notifying Robot %s that vertex %s is now available", next_robot_id, vertex_id)
                 return True, next_robot_id
+            self._prune_vertex(vertex_id, vertex)
             return True, None
         return False, None
     
+    def take_dirty(self):
+        """Get the lanes, as (from_vertex, to_vertex), and vertices that changed since the last call"""
+        lanes = [(lane_key >> LANE_KEY_SHIFT, lane_key & LANE_KEY_MASK) for lane_key in self.dirty_lanes]
+        vertices = self.dirty_vertices
+        self.dirty_lanes = set()
+        self.dirty_vertices = set()
+        return lanes, vertices
+    
     def is_lane_occupied(self, from_vertex, to_vertex):
         """Check if a lane is currently occupied"""
-        return (from_vertex, to_vertex) in self.occupied_lanes
+        lane = self.lanes.get((from_vertex << LANE_KEY_SHIFT) | to_vertex)
+        return lane is not None and lane.occupant is not None
     
     def is_vertex_occupied(self, vertex_id, robot_id=None):
         """
         Check if a vertex is currently occupied by any robot other than robot_id
         If robot_id is None, check if occupied by any robot
         """
-        if vertex_id not in self.occupied_vertices:
+        vertex = self.vertices.get(vertex_id)
+        if vertex is None or vertex.occupant is None:
             return False
             
         if robot_id is None:
             return True
             
         # Check if occupied by a different robot
-        return self.occupied_vertices[vertex_id] != robot_id
+        return vertex.occupant != robot_id
     
     def get_occupying_robot(self, from_vertex, to_vertex):
         """Get the ID of the robot occupying a lane"""
-        lane_key = (from_vertex, to_vertex)
-        if lane_key in self.occupied_lanes:
-            return self.occupied_lanes[lane_key]
-        return None
+        lane = self.lanes.get((from_vertex << LANE_KEY_SHIFT) | to_vertex)
+        return lane.occupant if lane is not None else None
     
     def get_vertex_occupying_robot(self, vertex_id):
         """Get the ID of the robot occupying a vertex"""
-        if vertex_id in self.occupied_vertices:
-            return self.occupied_vertices[vertex_id]
-        return None
+        vertex = self.vertices.get(vertex_id)
+        return vertex.occupant if vertex is not None else None
     
     def get_queue_position(self, robot_id, from_vertex, to_vertex):
         """Get the position of a robot in the queue for a lane"""
-        lane_key = (from_vertex, to_vertex)
-        if robot_id in self.lane_queues[lane_key]:
-            return self.lane_queues[lane_key].index(robot_id) + 1
-        return 0
+        lane = self.lanes.get((from_vertex << LANE_KEY_SHIFT) | to_vertex)
+        if lane is None or not lane.queue:
+            return 0
+        return lane.queue.position(robot_id)
     
     def get_vertex_queue_position(self, robot_id, vertex_id):
         """Get the position of a robot in the queue for a vertex"""
-        if robot_id in self.vertex_queues[vertex_id]:
-            return self.vertex_queues[vertex_id].index(robot_id) + 1
-        return 0
+        vertex = self.vertices.get(vertex_id)
+        if vertex is None or not vertex.queue:
+            return 0
+        return vertex.queue.position(robot_id)
     
     def get_waiting_robots_at_vertex(self, vertex_id):
-        """Get list of robots waiting at a vertex"""
-        return self.waiting_at_vertex.get(vertex_id, [])
+        """Get a tuple of the robots waiting at a vertex, in arrival order"""
+        vertex = self.vertices.get(vertex_id)
+        if vertex is None or vertex.waiting is None:
+            return ()
+        return tuple(vertex.waiting)
     
     def get_queue_length(self, from_vertex, to_vertex):
         """Get the number of robots waiting for a lane"""
-        lane_key = (from_vertex, to_vertex)
-        return len(self.lane_queues[lane_key])
+        lane = self.lanes.get((from_vertex << LANE_KEY_SHIFT) | to_vertex)
+        if lane is None or lane.queue is None:
+            return 0
+        return len(lane.queue)
     
     def get_vertex_queue_length(self, vertex_id):
         """Get the number of robots waiting for a vertex"""
-        return len(self.vertex_queues[vertex_id])
\ No newline at end of file
+        vertex = self.vertices.get(vertex_id)
+        if vertex is None or vertex.queue is None:
+            return 0
+        return len(vertex.queue)
\ No newline at end of file
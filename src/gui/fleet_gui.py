@@ -1,8 +1,16 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import math
+from tkinter import ttk
+import tkinter.font as tkfont
 import time
-import threading
+import logging
+from itertools import islice
+
+from src.models.robot import Robot
+
+# Robot statuses bound once at module level for the per-robot loops
+_MOVING = Robot.STATUS_MOVING
+_WAITING = Robot.STATUS_WAITING
+_CHARGING = Robot.STATUS_CHARGING
 
 class FleetGUI:
     # Constants
@@ -14,6 +22,20 @@ class FleetGUI:
     VERTEX_COLOR = "#808080"   # Gray
     LANE_COLOR = "#A0A0A0"     # Light Gray
     SELECTION_COLOR = "#FF0000"  # Red
+    UPDATE_INTERVAL = 1.0 / 30  # Target 30 FPS
+    TOAST_DURATION_MS = 3000  # How long feedback messages stay up
+    RESIZE_DELAY_MS = 100  # Quiet time after the last resize event before rescaling
+    FREE_LANE_STATE = (None, 0)  # Lane state drawn by the base lane lines alone
+    
+    # Status indicator colors
+    _STATUS_COLOR = {
+        Robot.STATUS_IDLE: "#808080",      # Gray
+        Robot.STATUS_MOVING: "#00FF00",    # Green
+        Robot.STATUS_WAITING: "#FFA500",   # Orange
+        Robot.STATUS_CHARGING: "#FFD700",  # Gold
+        Robot.STATUS_COMPLETED: "#00FFFF", # Cyan
+        Robot.STATUS_BLOCKED: "#FF0000"    # Red for blocked status
+    }
     
     def __init__(self, root, nav_graph, fleet_manager, traffic_manager, logger):
         self.root = root
@@ -26,6 +48,12 @@ class FleetGUI:
         self.root.title("Fleet Management System")
         self.root.geometry(f"{self.CANVAS_WIDTH + 200}x{self.CANVAS_HEIGHT}")
         
+        # Canvas fonts, resolved once by Tk instead of for every text item
+        self._font_small = tkfont.Font(root=self.root, family="Arial", size=7)
+        self._font_bold7 = tkfont.Font(root=self.root, family="Arial", size=7, weight="bold")
+        self._font_label = tkfont.Font(root=self.root, family="Arial", size=8)
+        self._font_bold8 = tkfont.Font(root=self.root, family="Arial", size=8, weight="bold")
+        
         # Scale factors for drawing nav_graph
         self.scale_x = 1.0
         self.scale_y = 1.0
@@ -54,8 +82,9 @@ class FleetGUI:
         self.status_frame = ttk.Frame(self.side_panel)
         self.status_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        # Create status indicators with all robot statuses
+        # Create status indicators with all robot statuses, backed by Tk variables
         self.status_labels = {}
+        self.status_vars = {}
         statuses = [
             ("idle", "Idle"),
             ("moving", "Moving"),
@@ -69,9 +98,13 @@ class FleetGUI:
             frame = ttk.Frame(self.status_frame)
             frame.pack(fill=tk.X, pady=2)
             ttk.Label(frame, text=f"{status_text}:").pack(side=tk.LEFT)
-            self.status_labels[status_key] = ttk.Label(frame, text="0")
+            self.status_vars[status_key] = tk.StringVar(self.root, value="0")
+            self.status_labels[status_key] = ttk.Label(frame, textvariable=self.status_vars[status_key])
             self.status_labels[status_key].pack(side=tk.RIGHT)
         
+        # Counts currently shown by the status labels
+        self._shown_counts = {status_key: 0 for status_key in self.status_labels}
+        
         # Instructions section
         ttk.Separator(self.side_panel).pack(fill=tk.X, pady=5)
         ttk.Label(self.side_panel, text="Instructions", font=("Arial", 10, "bold")).pack(pady=5)
@@ -89,8 +122,16 @@ class FleetGUI:
         # Current selection info
         ttk.Separator(self.side_panel).pack(fill=tk.X, pady=5)
         ttk.Label(self.side_panel, text="Selection", font=("Arial", 10, "bold")).pack(pady=5)
-        self.selection_info = ttk.Label(self.side_panel, text="None selected", wraplength=180)
+        self.selection_var = tk.StringVar(self.root, value="None selected")
+        self.selection_info = ttk.Label(self.side_panel, textvariable=self.selection_var, wraplength=180)
         self.selection_info.pack(padx=5, pady=5)
+        self._shown_selection_text = "None selected"  # Text the selection label shows
+        
+        # Short-lived feedback messages, shown here instead of modal dialogs
+        # so the update loop keeps running while they are up
+        self.toast = ttk.Label(self.side_panel, text="", wraplength=180)
+        self.toast.pack(padx=5, pady=5)
+        self._toast_job = None  # Pending after() job that clears the toast
         
         # Control buttons
         self.control_frame = ttk.Frame(self.side_panel)
@@ -102,50 +143,121 @@ class FleetGUI:
         # Initialize selection state
         self.selected_robot = None
         
-        # Calculate scaling factors based on nav_graph
+        # Canvas items are created once and then updated in place
+        self.reset_canvas_items()
+        
+        # Calculate scaling factors based on nav_graph, redone after a resize
+        self.canvas_width = self.CANVAS_WIDTH
+        self.canvas_height = self.CANVAS_HEIGHT
+        self._pending_size = None  # Latest canvas size not applied yet
+        self._resize_job = None  # Pending after() job that applies it
+        self._rebuild_vertex_cache()
         self.calculate_scaling_factors()
+        self.update_canvas_coords()
         
         # Set up canvas interactions
         self.canvas.bind("<Button-1>", self.on_canvas_click)
+        self.canvas.bind("<Configure>", self.on_canvas_configure)
         
-        # Start update loop
+        # Start update loop on the Tk event loop
         self.running = True
-        self.last_update_time = time.time()
-        self.update_thread = threading.Thread(target=self.update_loop)
-        self.update_thread.daemon = True
-        self.update_thread.start()
+        # perf_counter is monotonic and, unlike monotonic() on Windows, has
+        # sub-millisecond resolution, which matters for 33 ms frames
+        self.last_update_time = time.perf_counter()
+        self._next_tick_time = self.last_update_time  # Deadline of the next step
+        self._tick_job = self.root.after_idle(self._tick)  # Pending after() job, cancelled by stop()
+    
+    def reset_canvas_items(self):
+        """Forget all canvas items, so the next frame creates and draws everything again"""
+        self._nav_graph_drawn = False
+        self._lane_coords = {}  # Format: {(from_vertex, to_vertex): (from_x, from_y, to_x, to_y)}
+        self._lane_perp = {}  # Format: {(from_vertex, to_vertex): (mid_x, mid_y, offset_x, offset_y)}
+        self._lane_arrow_ids = {}  # Direction arrows of occupied lanes
+        self._vertex_ids = {}  # Format: {vertex_index: (item, canvas_x, canvas_y)}
+        self._robot_ids = {}  # Format: {robot_id: (body, label, status)}
+        self._lane_label_ids = {}  # Occupying robot labels of occupied lanes
+        self._lane_queue_ids = {}  # Queue length badges of occupied lanes
+        self._vertex_queue_ids = {}  # Queue length badges of occupied vertices
+        self._vertex_waiting_ids = {}  # "Waiting: ..." texts under vertices
+        self._progress_bar_ids = {}  # Progress bars of moving/charging robots
+        self._robot_waiting_ids = {}  # "Waiting for ..." texts under robots
+        self._item_state = {}  # Last options applied to each item
+        self._item_coords = {}  # Last coords applied to each item
+        
+        # State each lane, vertex and robot was last drawn with, so only the
+        # ones that changed are updated
+        self._lane_state = {}  # Format: {(from_vertex, to_vertex): (occupying_robot, queue_length)}
+        self._vertex_state = {}  # Format: {vertex_index: (occupied, queue_length, waiting_robots, selected)}
+        self._robot_state = {}  # Format: {robot_id: (pos, status, selected, progress, waiting_text)}
+        self._drawn_selected_robot = None  # Robot last drawn as selected
+        self._drawn_selected_vertex = None  # Vertex last highlighted for the selected robot
+        self._redraw_all_robots = True  # Draw every robot next frame, not only the dirty ones
+        
+        # Robots bucketed by the grid cell of their drawn position, for click hit-testing
+        self._robot_buckets = {}  # Format: {(cell_x, cell_y): {robot_id, ...}}
+        self._robot_cells = {}  # Format: {robot_id: (cell_x, cell_y)}
+    
+    def on_canvas_configure(self, event):
+        """Rescale the nav_graph when the canvas is resized, once the size settles"""
+        # <Configure> fires for every pixel while a window edge is dragged, so
+        # the rescale waits until no new size arrived for RESIZE_DELAY_MS
+        if (event.width, event.height) == (self.canvas_width, self.canvas_height):
+            self._pending_size = None
+        else:
+            self._pending_size = (event.width, event.height)
+        if self._resize_job is not None:
+            self.root.after_cancel(self._resize_job)
+            self._resize_job = None
+        if self._pending_size is not None:
+            self._resize_job = self.root.after(self.RESIZE_DELAY_MS, self.apply_resize)
+    
+    def apply_resize(self):
+        """Rescale the nav_graph to the new canvas size and recreate the canvas items"""
+        self._resize_job = None
+        self.canvas_width, self.canvas_height = self._pending_size
+        self._pending_size = None
+        self.calculate_scaling_factors()
+        self.update_canvas_coords()
+        self.canvas.delete("all")
+        self.reset_canvas_items()
+        self.request_redraw()
+    
+    def _rebuild_vertex_cache(self):
+        """Cache the static per-vertex data of the nav_graph in lists indexed by vertex index"""
+        vertex_indices = range(len(self.nav_graph.vertex_map))
+        self._vertex_coords = [self.nav_graph.get_vertex_coords(i) for i in vertex_indices]
+        self._vertex_is_charger = [self.nav_graph.is_charger(i) for i in vertex_indices]
+        self._vertex_name = [self.nav_graph.get_vertex_name(i) for i in vertex_indices]
     
     def calculate_scaling_factors(self):
         """Calculate scaling factors to position the nav_graph on the canvas"""
-        # Get min and max coordinates to understand the graph dimensions
-        min_x, min_y = float('inf'), float('inf')
-        max_x, max_y = float('-inf'), float('-inf')
+        # Debug output is only formatted when debug logging is on
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Calculating scaling factors for graph...")
+            for vertex_index, coords in enumerate(self._vertex_coords):
+                if not coords:
+                    self.logger.debug("Warning: Vertex %s has no coordinates", vertex_index)
+                else:
+                    self.logger.debug("Vertex %s coords: %s", vertex_index, coords)
         
-        print("Calculating scaling factors for graph...")
-        vertex_count = 0
+        xs = [coords[0] for coords in self._vertex_coords if coords]
+        ys = [coords[1] for coords in self._vertex_coords if coords]
         
-        for vertex_index in self.nav_graph.vertex_map:
-            coords = self.nav_graph.get_vertex_coords(vertex_index)
-            if not coords:
-                print(f"Warning: Vertex {vertex_index} has no coordinates")
-                continue
-                
-            print(f"Vertex {vertex_index} coords: {coords}")
-            min_x = min(min_x, coords[0])
-            min_y = min(min_y, coords[1])
-            max_x = max(max_x, coords[0])
-            max_y = max(max_y, coords[1])
-            vertex_count += 1
-        
-        if vertex_count == 0:
-            print("Warning: No vertices with coordinates found")
+        if not xs:
+            self.logger.warning("No vertices with coordinates found")
             self.scale_x = 1.0
             self.scale_y = 1.0
             self.offset_x = 50
             self.offset_y = 50
             return
         
-        print(f"Graph bounds: ({min_x}, {min_y}) to ({max_x}, {max_y})")
+        # Get min and max coordinates to understand the graph dimensions
+        min_x, max_x = min(xs), max(xs)
+        min_y, max_y = min(ys), max(ys)
+        
+        if debug:
+            self.logger.debug("Graph bounds: (%s, %s) to (%s, %s)", min_x, min_y, max_x, max_y)
         
         # Determine graph dimensions
         graph_width = max_x - min_x
@@ -154,8 +266,8 @@ class FleetGUI:
         # Calculate scaling factors to fit the graph on the canvas
         # Leave some margin around the edges
         margin = 50
-        canvas_usable_width = self.CANVAS_WIDTH - 2 * margin
-        canvas_usable_height = self.CANVAS_HEIGHT - 2 * margin
+        canvas_usable_width = self.canvas_width - 2 * margin
+        canvas_usable_height = self.canvas_height - 2 * margin
         
         # Prevent division by zero
         if graph_width > 0:
@@ -177,8 +289,9 @@ class FleetGUI:
         self.offset_x = margin + (canvas_usable_width - graph_width * scale) / 2 - min_x * scale
         self.offset_y = margin + (canvas_usable_height - graph_height * scale) / 2 - min_y * scale
         
-        print(f"Scale factors: ({self.scale_x}, {self.scale_y})")
-        print(f"Centering offsets: ({self.offset_x}, {self.offset_y})")
+        if debug:
+            self.logger.debug("Scale factors: (%s, %s)", self.scale_x, self.scale_y)
+            self.logger.debug("Centering offsets: (%s, %s)", self.offset_x, self.offset_y)
 
     def world_to_canvas(self, world_x, world_y):
         """Convert world coordinates to canvas coordinates"""
@@ -186,235 +299,524 @@ class FleetGUI:
         canvas_y = world_y * self.scale_y + self.offset_y
         return canvas_x, canvas_y
     
-    def draw_nav_graph(self):
-        """Draw the navigation graph on the canvas"""
-        # Clear canvas
-        self.canvas.delete("all")
+    def update_canvas_coords(self):
+        """Cache the canvas coordinates of every vertex, must be redone when the scaling changes"""
+        # Indexed by vertex like the other vertex caches, None without coordinates
+        scale_x, scale_y, offset_x, offset_y = self.scale_x, self.scale_y, self.offset_x, self.offset_y
+        self._vertex_canvas_coords = [(coords[0] * scale_x + offset_x, coords[1] * scale_y + offset_y) if coords else None
+                                      for coords in self._vertex_coords]
+        
+        # Bucket the vertices into a grid of cells one vertex wide, so a click
+        # only has to be tested against the vertices in the cells around it
+        cell_size = 2 * self.VERTEX_RADIUS
+        self._vertex_buckets = {}  # Format: {(cell_x, cell_y): [vertex_index, ...]}
+        for vertex_index, canvas_coords in enumerate(self._vertex_canvas_coords):
+            if canvas_coords is None:
+                continue
+            canvas_x, canvas_y = canvas_coords
+            cell = (int(canvas_x // cell_size), int(canvas_y // cell_size))
+            self._vertex_buckets.setdefault(cell, []).append(vertex_index)
+    
+    def find_vertex_at(self, canvas_x, canvas_y):
+        """Get the vertex under a canvas point, or None if there is none"""
+        # A vertex within VERTEX_RADIUS of the point lies in the point's cell
+        # or one of the 8 cells around it
+        cell_size = 2 * self.VERTEX_RADIUS
+        cell_x = int(canvas_x // cell_size)
+        cell_y = int(canvas_y // cell_size)
+        vertex_radius_sq = self.VERTEX_RADIUS * self.VERTEX_RADIUS
+        
+        # Where vertices overlap, the lowest index wins like it did with a
+        # linear scan
+        hit = None
+        for bucket_x in (cell_x - 1, cell_x, cell_x + 1):
+            for bucket_y in (cell_y - 1, cell_y, cell_y + 1):
+                for vertex_index in self._vertex_buckets.get((bucket_x, bucket_y), ()):
+                    vertex_canvas_x, vertex_canvas_y = self._vertex_canvas_coords[vertex_index]
+                    dx = canvas_x - vertex_canvas_x
+                    dy = canvas_y - vertex_canvas_y
+                    if dx*dx + dy*dy <= vertex_radius_sq and (hit is None or vertex_index < hit):
+                        hit = vertex_index
+        return hit
+    
+    def set_robot_cell(self, robot_id, pos):
+        """Move a robot to the grid cell of its drawn position, or out of the grid if pos is None"""
+        cell_size = 2 * self.ROBOT_RADIUS
+        cell = (int(pos[0] // cell_size), int(pos[1] // cell_size)) if pos else None
+        old_cell = self._robot_cells.get(robot_id)
+        if cell == old_cell:
+            return
+        if old_cell is not None:
+            bucket = self._robot_buckets[old_cell]
+            bucket.discard(robot_id)
+            if not bucket:
+                del self._robot_buckets[old_cell]
+        if cell is None:
+            self._robot_cells.pop(robot_id, None)
+        else:
+            self._robot_cells[robot_id] = cell
+            self._robot_buckets.setdefault(cell, set()).add(robot_id)
+    
+    def find_robot_at(self, canvas_x, canvas_y):
+        """Get the ID of the robot drawn under a canvas point, or None if there is none"""
+        # Same 3x3 cell search as find_vertex_at, on the positions robots were
+        # last drawn at
+        cell_size = 2 * self.ROBOT_RADIUS
+        cell_x = int(canvas_x // cell_size)
+        cell_y = int(canvas_y // cell_size)
+        robot_radius_sq = self.ROBOT_RADIUS * self.ROBOT_RADIUS
+        
+        # Where robots overlap, the lowest ID (first spawned) wins
+        hit = None
+        for bucket_x in (cell_x - 1, cell_x, cell_x + 1):
+            for bucket_y in (cell_y - 1, cell_y, cell_y + 1):
+                for robot_id in self._robot_buckets.get((bucket_x, bucket_y), ()):
+                    robot_canvas_x, robot_canvas_y = self._robot_state[robot_id][0]
+                    dx = canvas_x - robot_canvas_x
+                    dy = canvas_y - robot_canvas_y
+                    if dx*dx + dy*dy <= robot_radius_sq and (hit is None or robot_id < hit):
+                        hit = robot_id
+        return hit
+    
+    def robot_canvas_position(self, robot):
+        """Get the canvas position of a robot from the cached vertex coordinates"""
+        # The canvas transform is linear, so interpolate between the lane ends' canvas points
+        if robot.status == _MOVING and robot.current_lane:
+            from_vertex, to_vertex = robot.current_lane
+            from_x, from_y = self._vertex_canvas_coords[from_vertex]
+            to_x, to_y = self._vertex_canvas_coords[to_vertex]
+            return (from_x + (to_x - from_x) * robot.progress,
+                    from_y + (to_y - from_y) * robot.progress)
+        return self._vertex_canvas_coords[robot.current_vertex]
+    
+    def _configure_item(self, item, **options):
+        """Apply the options of a canvas item that changed, skipping the call if none did"""
+        state = self._item_state.setdefault(item, {})
+        changed = {key: value for key, value in options.items() if state.get(key) != value}
+        if changed:
+            state.update(changed)
+            self.canvas.itemconfigure(item, **changed)
+    
+    def _move_item(self, item, *coords):
+        """Move a canvas item, skipping the call if it did not move"""
+        if self._item_coords.get(item) != coords:
+            self._item_coords[item] = coords
+            self.canvas.coords(item, *coords)
+    
+    def _delete_items(self, *items):
+        """Delete canvas items and forget their cached state"""
+        for item in items:
+            self.canvas.delete(item)
+            self._item_state.pop(item, None)
+            self._item_coords.pop(item, None)
+    
+    def _keep_below(self, item, *tags):
+        """Keep a newly created item underneath the items of the first tag that has any"""
+        for tag in tags:
+            if self.canvas.find_withtag(tag):
+                self.canvas.tag_lower(item, tag)
+                return
+    
+    def _show_badge(self, badges, key, x, y, radius, fill, text, tag, below):
+        """Show a circle with a small label at (x, y), creating it if needed"""
+        items = badges.get(key)
+        if items is None:
+            oval = self.canvas.create_oval(x - radius, y - radius, x + radius, y + radius, fill=fill, tags=tag)
+            label = self.canvas.create_text(x, y, text=text, font=self._font_bold7, tags=tag)
+            self._item_state[oval] = {"state": tk.NORMAL}
+            self._item_state[label] = {"text": text, "state": tk.NORMAL}
+            self._item_coords[oval] = (x - radius, y - radius, x + radius, y + radius)
+            self._item_coords[label] = (x, y)
+            self._keep_below(oval, below)
+            self._keep_below(label, below)
+            badges[key] = (oval, label)
+            return
         
+        oval, label = items
+        self._move_item(oval, x - radius, y - radius, x + radius, y + radius)
+        self._move_item(label, x, y)
+        self._configure_item(oval, state=tk.NORMAL)
+        self._configure_item(label, text=text, state=tk.NORMAL)
+    
+    def _show_text(self, texts, key, x, y, text, below=None):
+        """Show an orange info text at (x, y), creating it if needed"""
+        item = texts.get(key)
+        if item is None:
+            item = self.canvas.create_text(x, y, text=text, font=self._font_small, fill="#FF6600")
+            self._item_state[item] = {"text": text, "state": tk.NORMAL}
+            self._item_coords[item] = (x, y)
+            if below is not None:
+                self._keep_below(item, below)
+            texts[key] = item
+            return
+        
+        self._move_item(item, x, y)
+        self._configure_item(item, text=text, state=tk.NORMAL)
+    
+    def _hide(self, items, key):
+        """Hide the item (or tuple of items) shown for key, if any, so it can be shown again later"""
+        entry = items.get(key)
+        if entry is not None:
+            for item in (entry if isinstance(entry, tuple) else (entry,)):
+                self._configure_item(item, state=tk.HIDDEN)
+    
+    def _delete(self, items, key):
+        """Delete the item (or tuple of items) for key, if any"""
+        entry = items.pop(key, None)
+        if entry is not None:
+            self._delete_items(*(entry if isinstance(entry, tuple) else (entry,)))
+    
+    def create_nav_graph_items(self):
+        """Create the canvas items for lanes, vertices and vertex names once"""
         # Draw lanes
-        for lane in self.nav_graph.lanes:
-            from_vertex, to_vertex = lane[0], lane[1]
-            
-            from_coords = self.nav_graph.get_vertex_coords(from_vertex)
-            to_coords = self.nav_graph.get_vertex_coords(to_vertex)
+        undirected_lanes = set()
+        vertex_canvas_coords = self._vertex_canvas_coords
+        vertex_count = len(vertex_canvas_coords)
+        for from_vertex, to_vertex in self.nav_graph.lanes:
+            from_coords = vertex_canvas_coords[from_vertex] if 0 <= from_vertex < vertex_count else None
+            to_coords = vertex_canvas_coords[to_vertex] if 0 <= to_vertex < vertex_count else None
             
             if not from_coords or not to_coords:
-                print(f"Missing coordinates for lane {from_vertex} -> {to_vertex}")
+                self.logger.debug("Missing coordinates for lane %s -> %s", from_vertex, to_vertex)
                 continue
                 
-            from_x, from_y = self.world_to_canvas(*from_coords)
-            to_x, to_y = self.world_to_canvas(*to_coords)
-            
-            # Check if lane is occupied
-            lane_color = self.LANE_COLOR
-            lane_width = 2
+            self._lane_coords[(from_vertex, to_vertex)] = from_coords + to_coords
             
-            if self.traffic_manager.is_lane_occupied(from_vertex, to_vertex):
-                # Occupied lane
-                lane_color = "#FF6666"  # Light red for occupied lanes
-                lane_width = 3  # Thicker lines for occupied lanes
-                
-                # Get the occupying robot's ID
-                robot_id = self.traffic_manager.get_occupying_robot(from_vertex, to_vertex)
-                
-                # Draw direction arrow
-                self.draw_arrow(from_x, from_y, to_x, to_y, lane_color, lane_width)
-                
-                # Draw small label with robot ID
-                mid_x = (from_x + to_x) / 2
-                mid_y = (from_y + to_y) / 2
-                self.canvas.create_oval(mid_x-8, mid_y-8, mid_x+8, mid_y+8, fill="white")
-                self.canvas.create_text(mid_x, mid_y, text=str(robot_id), font=("Arial", 7, "bold"))
-                
-                # Check if there are robots waiting for this lane and visualize the queue
-                queue_length = self.traffic_manager.get_queue_length(from_vertex, to_vertex)
-                if queue_length > 0:
-                    # Draw a small indicator showing queue length
-                    offset_x = (to_y - from_y) * 0.1  # Perpendicular offset
-                    offset_y = -(to_x - from_x) * 0.1
-                    self.canvas.create_oval(
-                        mid_x + offset_x - 10, 
-                        mid_y + offset_y - 10, 
-                        mid_x + offset_x + 10, 
-                        mid_y + offset_y + 10, 
-                        fill="#FFA500"  # Orange for waiting
-                    )
-                    self.canvas.create_text(mid_x + offset_x, mid_y + offset_y, 
-                                        text=f"{queue_length}", font=("Arial", 7, "bold"))
-            else:
-                # Free lane - normal line
-                self.canvas.create_line(from_x, from_y, to_x, to_y, fill=lane_color, width=lane_width)
+            # Lane midpoint for the robot label, and the perpendicular offset
+            # of the queue badge from it
+            from_x, from_y = from_coords
+            to_x, to_y = to_coords
+            self._lane_perp[(from_vertex, to_vertex)] = (
+                (from_x + to_x) / 2, (from_y + to_y) / 2, (to_y - from_y) * 0.1, -(to_x - from_x) * 0.1)
+            if from_vertex != to_vertex:
+                undirected_lanes.add((min(from_vertex, to_vertex), max(from_vertex, to_vertex)))
+        
+        # Free lanes are drawn as one polyline per connected group
+        for walk in self._lane_walks(undirected_lanes):
+            coords = [c for vertex_index in walk for c in vertex_canvas_coords[vertex_index]]
+            self.canvas.create_line(*coords, fill=self.LANE_COLOR, width=2, tags="lane")
         
         # Draw vertices
-        for vertex_index in self.nav_graph.vertex_map:
-            coords = self.nav_graph.get_vertex_coords(vertex_index)
+        for vertex_index, coords in enumerate(vertex_canvas_coords):
             if not coords:
-                print(f"Missing coordinates for vertex {vertex_index}")
+                self.logger.debug("Missing coordinates for vertex %s", vertex_index)
                 continue
                 
-            canvas_x, canvas_y = self.world_to_canvas(*coords)
+            canvas_x, canvas_y = coords
             
             # Determine color based on whether it's a charger
-            vertex_color = self.CHARGER_COLOR if self.nav_graph.is_charger(vertex_index) else self.VERTEX_COLOR
-            
-            # Check if vertex is occupied
-            outline_color = "black"
-            outline_width = 1
-            
-            # If vertex is occupied, highlight it
-            if self.traffic_manager.is_vertex_occupied(vertex_index):
-                outline_color = "#0000FF"  # Blue outline for occupied vertices
-                outline_width = 2
-                
-                # Check if there's a queue for this vertex
-                queue_length = self.traffic_manager.get_vertex_queue_length(vertex_index)
-                if queue_length > 0:
-                    # Show queue indicator
-                    self.canvas.create_oval(
-                        canvas_x + self.VERTEX_RADIUS - 5,
-                        canvas_y - self.VERTEX_RADIUS - 15,
-                        canvas_x + self.VERTEX_RADIUS + 5,
-                        canvas_y - self.VERTEX_RADIUS - 5,
-                        fill="#FFA500"  # Orange for waiting
-                    )
-                    self.canvas.create_text(
-                        canvas_x + self.VERTEX_RADIUS, 
-                        canvas_y - self.VERTEX_RADIUS - 10, 
-                        text=str(queue_length), 
-                        font=("Arial", 7, "bold")
-                    )
+            vertex_color = self.CHARGER_COLOR if self._vertex_is_charger[vertex_index] else self.VERTEX_COLOR
             
-            # Special highlight for selected robot's vertex
-            if self.selected_robot is not None:
-                robot = self.fleet_manager.robots.get(self.selected_robot)
-                if robot and robot.current_vertex == vertex_index:
-                    outline_color = self.SELECTION_COLOR
-                    outline_width = 3
-            
-            # Draw the vertex
-            self.canvas.create_oval(
+            item = self.canvas.create_oval(
                 canvas_x - self.VERTEX_RADIUS, canvas_y - self.VERTEX_RADIUS,
                 canvas_x + self.VERTEX_RADIUS, canvas_y + self.VERTEX_RADIUS,
-                fill=vertex_color, outline=outline_color, width=outline_width, tags=f"vertex_{vertex_index}"
+                fill=vertex_color, outline="black", width=1, tags=("vertex", f"vertex_{vertex_index}")
             )
+            self._item_state[item] = {"outline": "black", "width": 1}
+            self._vertex_ids[vertex_index] = (item, canvas_x, canvas_y)
             
             # Add vertex name
-            vertex_name = self.nav_graph.get_vertex_name(vertex_index)
+            vertex_name = self._vertex_name[vertex_index]
             if vertex_name:
-                self.canvas.create_text(canvas_x, canvas_y, text=vertex_name, font=("Arial", 8))
-                
-            # Show robots waiting at this vertex
+                self.canvas.create_text(canvas_x, canvas_y, text=vertex_name, font=self._font_label,
+                                        tags=("vertex", f"vertex_{vertex_index}"))
+        
+        self._nav_graph_drawn = True
+    
+    def _lane_walks(self, lanes):
+        """
+        Split undirected lanes into walks of connected vertices that cover
+        every lane, walking back over drawn lanes where a walk has to turn back
+        """
+        neighbors = {}
+        for a, b in lanes:
+            neighbors.setdefault(a, []).append(b)
+            neighbors.setdefault(b, []).append(a)
+        
+        walks = []
+        walked = set()
+        visited = set()
+        for start in neighbors:
+            if start in visited:
+                continue
+            
+            # Depth-first walk over the lanes, returning along the way we came
+            walk = [start]
+            walk_end = 1  # Length of the walk up to its last new lane
+            stack = [(start, iter(neighbors[start]))]
+            visited.add(start)
+            while stack:
+                vertex, next_vertices = stack[-1]
+                for next_vertex in next_vertices:
+                    lane = (min(vertex, next_vertex), max(vertex, next_vertex))
+                    if lane not in walked:
+                        walked.add(lane)
+                        visited.add(next_vertex)
+                        walk.append(next_vertex)
+                        walk_end = len(walk)
+                        stack.append((next_vertex, iter(neighbors[next_vertex])))
+                        break
+                else:
+                    stack.pop()
+                    if stack:
+                        walk.append(stack[-1][0])
+            
+            # Going back to the start after the last new lane draws nothing new
+            walks.append(walk[:walk_end])
+        return walks
+    
+    def draw_nav_graph(self):
+        """Update the parts of the navigation graph whose state changed since the last frame"""
+        # After the first frame only lanes and vertices reported as changed are visited
+        dirty_lanes, dirty_vertices = self.traffic_manager.take_dirty()
+        if not self._nav_graph_drawn:
+            self.create_nav_graph_items()
+            dirty_lanes = self._lane_coords
+            dirty_vertices = set(self._vertex_ids)
+        
+        # The selected robot's vertex is highlighted, so a new selection or a
+        # move of the selected robot changes the old and the new vertex too
+        selected = self.fleet_manager.robots.get(self.selected_robot) if self.selected_robot is not None else None
+        selected_vertex = selected.current_vertex if selected else None
+        if selected_vertex != self._drawn_selected_vertex:
+            dirty_vertices.add(self._drawn_selected_vertex)
+            dirty_vertices.add(selected_vertex)
+            self._drawn_selected_vertex = selected_vertex
+        
+        # Update lanes whose occupant or queue changed
+        lane_coords_by_lane = self._lane_coords
+        for lane in dirty_lanes:
+            lane_coords = lane_coords_by_lane.get(lane)
+            if lane_coords is None:
+                continue
+            occupying_robot = self.traffic_manager.get_occupying_robot(*lane)
+            queue_length = self.traffic_manager.get_queue_length(*lane) if occupying_robot is not None else 0
+            state = (occupying_robot, queue_length)
+            if self._lane_state.get(lane, self.FREE_LANE_STATE) != state:
+                self._lane_state[lane] = state
+                self.draw_lane(lane, lane_coords, occupying_robot, queue_length)
+        
+        # Update vertices whose occupancy, queue, waiting robots or selection changed
+        vertex_ids = self._vertex_ids
+        for vertex_index in sorted(v for v in dirty_vertices if v in vertex_ids):
+            vertex_item = vertex_ids[vertex_index]
+            occupied = self.traffic_manager.is_vertex_occupied(vertex_index)
+            queue_length = self.traffic_manager.get_vertex_queue_length(vertex_index) if occupied else 0
             waiting_robots = self.traffic_manager.get_waiting_robots_at_vertex(vertex_index)
-            if waiting_robots:
-                # Draw waiting indicator below vertex
-                waiting_text = ", ".join(map(str, waiting_robots))
-                if len(waiting_text) > 10:  # If too many robots, just show count
-                    waiting_text = f"{len(waiting_robots)} robots"
-                    
-                self.canvas.create_text(
-                    canvas_x, 
-                    canvas_y + self.VERTEX_RADIUS + 10, 
-                    text=f"Waiting: {waiting_text}", 
-                    font=("Arial", 7),
-                    fill="#FF6600"
-                )
-
-    def draw_arrow(self, from_x, from_y, to_x, to_y, color, width=2):
-        """Draw an arrow to indicate lane direction and occupancy"""
+            state = (occupied, queue_length, waiting_robots, vertex_index == selected_vertex)
+            if self._vertex_state.get(vertex_index) != state:
+                self._vertex_state[vertex_index] = state
+                self.draw_vertex(vertex_index, vertex_item, *state)
+    
+    def draw_lane(self, lane, lane_coords, occupying_robot, queue_length):
+        """Show or hide the arrow, robot label and queue badge of a lane"""
+        if occupying_robot is None:
+            # Free lane - the base line drawn for all lanes shows through
+            self._hide(self._lane_arrow_ids, lane)
+            self._hide(self._lane_label_ids, lane)
+            self._hide(self._lane_queue_ids, lane)
+            return
+        
+        from_vertex, to_vertex = lane
+        from_x, from_y, to_x, to_y = lane_coords
+        
+        # Occupied lane: light red, thicker and with a direction arrow
+        arrow = self._lane_arrow_ids.get(lane)
+        if arrow is None:
+            arrow = self.draw_arrow(from_x, from_y, to_x, to_y, "#FF6666", 3,
+                                    tags=("lane", f"lane_{from_vertex}_{to_vertex}"))
+            if arrow is not None:
+                self._lane_arrow_ids[lane] = arrow
+        else:
+            self._configure_item(arrow, state=tk.NORMAL)
+        
+        # Draw small label with robot ID
+        mid_x, mid_y, offset_x, offset_y = self._lane_perp[lane]
+        self._show_badge(self._lane_label_ids, lane, mid_x, mid_y, 8, "white",
+                         str(occupying_robot), "lane_badge", "vertex")
+        
+        # Visualize the queue if there are robots waiting for this lane
+        if queue_length > 0:
+            self._show_badge(self._lane_queue_ids, lane, mid_x + offset_x, mid_y + offset_y, 10, "#FFA500",
+                             f"{queue_length}", "lane_badge", "vertex")
+        else:
+            self._hide(self._lane_queue_ids, lane)
+    
+    def draw_vertex(self, vertex_index, vertex_item, occupied, queue_length, waiting_robots, selected):
+        """Restyle a vertex and show or hide its queue badge and waiting text"""
+        item, canvas_x, canvas_y = vertex_item
+        outline_color = "black"
+        outline_width = 1
+        
+        # If vertex is occupied, highlight it
+        if occupied:
+            outline_color = "#0000FF"  # Blue outline for occupied vertices
+            outline_width = 2
+        
+        # Special highlight for selected robot's vertex
+        if selected:
+            outline_color = self.SELECTION_COLOR
+            outline_width = 3
+        
+        self._configure_item(item, outline=outline_color, width=outline_width)
+        
+        # Show queue indicator if there's a queue for this vertex
+        if queue_length > 0:
+            self._show_badge(self._vertex_queue_ids, vertex_index, canvas_x + self.VERTEX_RADIUS,
+                             canvas_y - self.VERTEX_RADIUS - 10, 5, "#FFA500", str(queue_length),
+                             "vertex_badge", "robot")
+        else:
+            self._hide(self._vertex_queue_ids, vertex_index)
+        
+        # Show robots waiting at this vertex
+        if waiting_robots:
+            # Draw waiting indicator below vertex
+            waiting_text = ", ".join(map(str, waiting_robots))
+            if len(waiting_text) > 10:  # If too many robots, just show count
+                waiting_text = f"{len(waiting_robots)} robots"
+            
+            self._show_text(self._vertex_waiting_ids, vertex_index, canvas_x, canvas_y + self.VERTEX_RADIUS + 10,
+                            f"Waiting: {waiting_text}", "robot")
+        else:
+            self._hide(self._vertex_waiting_ids, vertex_index)
+    
+    def draw_arrow(self, from_x, from_y, to_x, to_y, color, width=2, tags=()):
+        """Draw an arrow to indicate lane direction and occupancy, returns None for a zero-length lane"""
         # Calculate direction vector
         dx = to_x - from_x
         dy = to_y - from_y
-        length = math.sqrt(dx*dx + dy*dy)
-        
-        if length < 1e-6:
-            return
         
-        # Normalize
-        dx /= length
-        dy /= length
+        # A zero-length lane has no direction to show
+        if dx*dx + dy*dy < 1e-12:
+            return None
         
-        # Draw the line
-        self.canvas.create_line(from_x, from_y, to_x, to_y, fill=color, width=width, arrow=tk.LAST)
+        # Draw the line, under the lane labels and vertices
+        arrow = self.canvas.create_line(from_x, from_y, to_x, to_y, fill=color, width=width, arrow=tk.LAST, tags=tags)
+        self._keep_below(arrow, "lane_badge", "vertex")
+        return arrow
     
     def draw_robots(self):
-        """Draw all robots on the canvas"""
-        for robot_id, robot in self.fleet_manager.robots.items():
-            pos = robot.get_current_position()
-            if pos:
-                canvas_x, canvas_y = self.world_to_canvas(*pos)
-                
-                # Different outline for selected robot
-                outline_color = self.SELECTION_COLOR if robot_id == self.selected_robot else "black"
-                outline_width = 3 if robot_id == self.selected_robot else 1
-                
-                # Draw the robot
-                self.canvas.create_oval(
-                    canvas_x - self.ROBOT_RADIUS, canvas_y - self.ROBOT_RADIUS,
-                    canvas_x + self.ROBOT_RADIUS, canvas_y + self.ROBOT_RADIUS,
-                    fill=robot.color, outline=outline_color, width=outline_width, tags=f"robot_{robot_id}"
-                )
-                
-                # Draw robot ID
-                self.canvas.create_text(canvas_x, canvas_y, text=str(robot_id), font=("Arial", 8, "bold"))
-                
-                # Draw status indicator
-                status_color = {
-                    robot.STATUS_IDLE: "#808080",      # Gray
-                    robot.STATUS_MOVING: "#00FF00",    # Green
-                    robot.STATUS_WAITING: "#FFA500",   # Orange
-                    robot.STATUS_CHARGING: "#FFD700",  # Gold
-                    robot.STATUS_COMPLETED: "#00FFFF", # Cyan
-                    robot.STATUS_BLOCKED: "#FF0000"    # Red for blocked status
-                }.get(robot.status, "#808080")
-                
-                self.canvas.create_rectangle(
-                    canvas_x - self.ROBOT_RADIUS, canvas_y - self.ROBOT_RADIUS - 8,
-                    canvas_x + self.ROBOT_RADIUS, canvas_y - self.ROBOT_RADIUS - 3,
-                    fill=status_color, outline="black"
-                )
-                
-                # Draw progress bar for moving or charging robots
-                if robot.status == robot.STATUS_MOVING:
-                    # Draw progress bar for movement
-                    bar_width = 2 * self.ROBOT_RADIUS * robot.progress
-                    self.canvas.create_rectangle(
-                        canvas_x - self.ROBOT_RADIUS, canvas_y + self.ROBOT_RADIUS + 3,
-                        canvas_x - self.ROBOT_RADIUS + bar_width, canvas_y + self.ROBOT_RADIUS + 6,
-                        fill="#00FF00", outline="black"
-                    )
-                elif robot.status == robot.STATUS_CHARGING:
-                    # Draw progress bar for charging
-                    bar_width = 2 * self.ROBOT_RADIUS * robot.charging_progress
-                    self.canvas.create_rectangle(
-                        canvas_x - self.ROBOT_RADIUS, canvas_y + self.ROBOT_RADIUS + 3,
-                        canvas_x - self.ROBOT_RADIUS + bar_width, canvas_y + self.ROBOT_RADIUS + 6,
-                        fill="#FFD700", outline="black"
-                    )
-                
-                # Draw waiting info for waiting robots
-                if robot.status == robot.STATUS_WAITING:
-                    # Get what the robot is waiting for (lane or vertex)
-                    waiting_info = robot.get_blocking_info(self.traffic_manager)
-                    
-                    if waiting_info:
-                        if "blocked_vertex" in waiting_info:
-                            waiting_text = f"Waiting for V{waiting_info['blocked_vertex']}"
-                        elif "blocked_lane" in waiting_info:
-                            from_v, to_v = waiting_info["blocked_lane"]
-                            waiting_text = f"Waiting for L{from_v}-{to_v}"
-                        else:
-                            waiting_text = "Waiting"
-                            
-                        if "blocking_robot" in waiting_info:
-                            waiting_text += f" (R{waiting_info['blocking_robot']})"
-                            
-                        self.canvas.create_text(
-                            canvas_x, 
-                            canvas_y + self.ROBOT_RADIUS + 12, 
-                            text=waiting_text, 
-                            font=("Arial", 7),
-                            fill="#FF6600"
-                        )
+        """Update the robots whose position or state changed since the last frame"""
+        # Bound to locals, this loop runs for every robot the fleet manager marked dirty
+        robot_state = self._robot_state
+        selected_robot = self.selected_robot
+        robot_canvas_position = self.robot_canvas_position
+        robots = self.fleet_manager.robots
+        
+        # Only robots the fleet manager stepped or woke since the last frame
+        # can have moved, plus the ones whose selection changed
+        dirty_robots = self.fleet_manager.take_dirty_robots()
+        if self._redraw_all_robots:
+            self._redraw_all_robots = False
+            dirty_robots.update(robots)
+        if selected_robot != self._drawn_selected_robot:
+            dirty_robots.add(self._drawn_selected_robot)
+            dirty_robots.add(selected_robot)
+            self._drawn_selected_robot = selected_robot
+        
+        # Robot IDs are handed out in spawn order, so sorting them keeps the
+        # stacking order of newly created items the same as a full pass
+        for robot_id in sorted(robot_id for robot_id in dirty_robots if robot_id in robots):
+            robot = robots[robot_id]
+            pos = robot_canvas_position(robot)
+            if not pos:
+                continue
+            
+            # Progress bar for moving or charging robots
+            status = robot.status
+            if status == _MOVING:
+                progress = robot.progress
+            elif status == _CHARGING:
+                progress = robot.charging_progress
+            else:
+                progress = None
+            
+            # Waiting info for waiting robots
+            waiting_text = self.get_waiting_text(robot) if status == _WAITING else None
+            
+            state = (pos, status, robot_id == selected_robot, progress, waiting_text)
+            if robot_state.get(robot_id) != state:
+                robot_state[robot_id] = state
+                self.set_robot_cell(robot_id, pos)
+                self.draw_robot(robot, *state)
+        
+        # Remove robots that are gone
+        if len(self._robot_ids) > len(robots):
+            for robot_id in [robot_id for robot_id in self._robot_ids if robot_id not in robots]:
+                self._delete(self._robot_ids, robot_id)
+                self._delete(self._progress_bar_ids, robot_id)
+                self._delete(self._robot_waiting_ids, robot_id)
+                del self._robot_state[robot_id]
+                self.set_robot_cell(robot_id, None)
+    
+    def get_waiting_text(self, robot):
+        """Describe what a waiting robot is waiting for, or None if nothing is blocking it"""
+        # Get what the robot is waiting for (lane or vertex)
+        waiting_info = robot.get_blocking_info(self.traffic_manager)
+        if not waiting_info:
+            return None
+        
+        if "blocked_vertex" in waiting_info:
+            waiting_text = f"Waiting for V{waiting_info['blocked_vertex']}"
+        elif "blocked_lane" in waiting_info:
+            from_v, to_v = waiting_info["blocked_lane"]
+            waiting_text = f"Waiting for L{from_v}-{to_v}"
+        else:
+            waiting_text = "Waiting"
+            
+        if "blocking_robot" in waiting_info:
+            waiting_text += f" (R{waiting_info['blocking_robot']})"
+        return waiting_text
+    
+    def draw_robot(self, robot, pos, status, selected, progress, waiting_text):
+        """Move and restyle the canvas items of a robot"""
+        robot_id = robot.id
+        canvas_x, canvas_y = pos
+        
+        # Different outline for selected robot
+        outline_color = self.SELECTION_COLOR if selected else "black"
+        outline_width = 3 if selected else 1
+        
+        # Status indicator color
+        status_color = self._STATUS_COLOR.get(status, "#808080")
+        
+        items = self._robot_ids.get(robot_id)
+        if items is None:
+            # Create the robot body, its ID and the status indicator
+            tags = ("robot", f"robot_{robot_id}")
+            body = self.canvas.create_oval(0, 0, 0, 0, fill=robot.color, tags=tags)
+            label = self.canvas.create_text(0, 0, text=str(robot_id), font=self._font_bold8, tags=tags)
+            status_item = self.canvas.create_rectangle(0, 0, 0, 0, outline="black", tags=tags)
+            items = self._robot_ids[robot_id] = (body, label, status_item)
+        body, label, status_item = items
+        
+        self._move_item(body, canvas_x - self.ROBOT_RADIUS, canvas_y - self.ROBOT_RADIUS,
+                        canvas_x + self.ROBOT_RADIUS, canvas_y + self.ROBOT_RADIUS)
+        self._configure_item(body, outline=outline_color, width=outline_width)
+        self._move_item(label, canvas_x, canvas_y)
+        self._move_item(status_item, canvas_x - self.ROBOT_RADIUS, canvas_y - self.ROBOT_RADIUS - 8,
+                        canvas_x + self.ROBOT_RADIUS, canvas_y - self.ROBOT_RADIUS - 3)
+        self._configure_item(status_item, fill=status_color)
+        
+        # Draw progress bar for moving or charging robots
+        if progress is not None:
+            bar = self._progress_bar_ids.get(robot_id)
+            if bar is None:
+                bar = self._progress_bar_ids[robot_id] = self.canvas.create_rectangle(
+                    0, 0, 0, 0, outline="black", tags=("robot", f"robot_{robot_id}"))
+            bar_width = 2 * self.ROBOT_RADIUS * progress
+            self._move_item(bar, canvas_x - self.ROBOT_RADIUS, canvas_y + self.ROBOT_RADIUS + 3,
+                            canvas_x - self.ROBOT_RADIUS + bar_width, canvas_y + self.ROBOT_RADIUS + 6)
+            self._configure_item(bar, fill="#00FF00" if status == _MOVING else "#FFD700", state=tk.NORMAL)
+        else:
+            self._hide(self._progress_bar_ids, robot_id)
+        
+        # Draw waiting info for waiting robots
+        if waiting_text is not None:
+            self._show_text(self._robot_waiting_ids, robot_id, canvas_x, canvas_y + self.ROBOT_RADIUS + 12,
+                            waiting_text)
+        else:
+            self._hide(self._robot_waiting_ids, robot_id)
     
     def update_gui(self):
         """Update the GUI components"""
@@ -422,27 +824,30 @@ class FleetGUI:
         self.draw_nav_graph()
         self.draw_robots()
         
-        # Update status counts
-        status_counts = self.fleet_manager.get_robot_status_count()
-        for status, count in status_counts.items():
-            if status in self.status_labels:
-                self.status_labels[status].config(text=str(count))
+        self.update_status_labels()
         
-        # Update selection info
+        # Update selection info, the label is only touched when its text changes
+        selection_text = self.get_selection_text()
+        if selection_text != self._shown_selection_text:
+            self._shown_selection_text = selection_text
+            self.selection_var.set(selection_text)
+    
+    def get_selection_text(self):
+        """Describe the selected robot for the selection panel"""
         if self.selected_robot is not None:
             if self.selected_robot in self.fleet_manager.robots:
                 robot = self.fleet_manager.robots[self.selected_robot]
                 status_text = f"Robot {robot.id}\n"
                 status_text += f"Status: {robot.get_status_text()}\n"
-                status_text += f"Position: {self.nav_graph.get_vertex_name(robot.current_vertex)}\n"
+                status_text += f"Position: {self._vertex_name[robot.current_vertex]}\n"
                 
                 if robot.destination_vertex is not None:
-                    status_text += f"Destination: {self.nav_graph.get_vertex_name(robot.destination_vertex)}\n"
+                    status_text += f"Destination: {self._vertex_name[robot.destination_vertex]}\n"
                 
                 # Add path info if available
                 if robot.path:
-                    # Show next few vertices in path
-                    path_preview = [str(v) for v in robot.path[:3]]
+                    # Show next few vertices in path, the path is a deque so it can't be sliced
+                    path_preview = [str(v) for v in islice(robot.path, 3)]
                     if len(robot.path) > 3:
                         path_preview.append("...")
                     status_text += f"Next: {' → '.join(path_preview)}"
@@ -453,126 +858,130 @@ class FleetGUI:
                     if blocking_info:
                         status_text += f"\nBlocked by: Robot {blocking_info.get('blocking_robot', '?')}"
                 
-                self.selection_info.config(text=status_text)
+                return status_text
             else:
                 self.selected_robot = None
-                self.selection_info.config(text="None selected")
-        else:
-            self.selection_info.config(text="None selected")
+        return "None selected"
     
-    def update_loop(self):
-        """Main update loop for simulation"""
-        update_interval = 1.0 / 30  # Target 30 FPS
+    def request_redraw(self):
+        """Redraw on the next tick rather than right away, so clicks stay responsive"""
+        self.fleet_manager.dirty = True
+    
+    def update_status_labels(self):
+        """Update the status counts that changed"""
+        # The fleet manager keeps them up to date, so they are read directly
+        # instead of copied
+        for status, count in self.fleet_manager.status_counts.items():
+            if status in self.status_labels and self._shown_counts[status] != count:
+                self._shown_counts[status] = count
+                self.status_vars[status].set(str(count))
+    
+    def _tick(self):
+        """Advance the simulation by one step and redraw, then schedule the next step"""
+        if not self.running:
+            return
         
-        while self.running:
-            current_time = time.time()
-            dt = current_time - self.last_update_time
-            self.last_update_time = current_time
-            
-            # Update fleet manager (and robots)
-            self.fleet_manager.update(dt)
-            
-            # Update GUI on the main thread
-            self.root.after(0, self.update_gui)
-            
-            # Sleep to maintain target frame rate
-            time.sleep(max(0, update_interval - (time.time() - current_time)))
+        current_time = time.perf_counter()
+        dt = current_time - self.last_update_time
+        self.last_update_time = current_time
+        
+        # Update fleet manager (and robots)
+        self.fleet_manager.update(dt)
+        
+        # Redraw only if the fleet changed since the last frame
+        if self.fleet_manager.dirty:
+            self.fleet_manager.dirty = False
+            self.update_gui()
+        
+        # Schedule the next step on a fixed deadline, restarting it after an overrun
+        self._next_tick_time += self.UPDATE_INTERVAL
+        now = time.perf_counter()
+        delay = self._next_tick_time - now
+        if delay <= 0:
+            self._next_tick_time = now
+            delay = 0
+        self._tick_job = self.root.after(max(1, int(delay * 1000)), self._tick)
     
     def on_canvas_click(self, event):
         """Handle clicks on the canvas"""
         canvas_x, canvas_y = event.x, event.y
         
         # Check if a robot was clicked
-        for robot_id, robot in self.fleet_manager.robots.items():
-            pos = robot.get_current_position()
-            if pos:
-                robot_canvas_x, robot_canvas_y = self.world_to_canvas(*pos)
-                
-                # Check if click is within robot
-                dx = canvas_x - robot_canvas_x
-                dy = canvas_y - robot_canvas_y
-                distance = math.sqrt(dx*dx + dy*dy)
-                
-                if distance <= self.ROBOT_RADIUS:
-                    self.selected_robot = robot_id
-                    self.logger.info(f"Selected Robot {robot_id}")
-                    self.update_gui()
-                    return
+        robot_id = self.find_robot_at(canvas_x, canvas_y)
+        if robot_id is not None:
+            self.selected_robot = robot_id
+            self.logger.info(f"Selected Robot {robot_id}")
+            self.request_redraw()
+            return
         
         # Check if a vertex was clicked
-        for vertex_index in self.nav_graph.vertex_map:
-            coords = self.nav_graph.get_vertex_coords(vertex_index)
-            if not coords:
-                continue
-                
-            vertex_canvas_x, vertex_canvas_y = self.world_to_canvas(*coords)
-                
-            # Check if click is within vertex
-            dx = canvas_x - vertex_canvas_x
-            dy = canvas_y - vertex_canvas_y
-            distance = math.sqrt(dx*dx + dy*dy)
-                
-            if distance <= self.VERTEX_RADIUS:
-                # If a robot is selected, assign task
-                if self.selected_robot is not None:
-                    robot = self.fleet_manager.robots.get(self.selected_robot)
-                    if robot:
-                        # Check if this is a charging station and robot needs charging
-                        if self.nav_graph.is_charger(vertex_index):
-                            if robot.status != robot.STATUS_CHARGING:
-                                success = self.fleet_manager.assign_task(self.selected_robot, vertex_index)
-                                if success:
-                                    messagebox.showinfo("Task Assigned", 
-                                                      f"Robot {self.selected_robot} assigned to navigate to charging station at {self.nav_graph.get_vertex_name(vertex_index)}")
-                                else:
-                                    messagebox.showwarning("Task Assignment Failed", 
-                                                         f"Could not assign Robot {self.selected_robot} to navigate to charging station at {self.nav_graph.get_vertex_name(vertex_index)}")
-                        else:
-                            # Regular navigation task
+        vertex_index = self.find_vertex_at(canvas_x, canvas_y)
+        if vertex_index is not None:
+            # If a robot is selected, assign task
+            if self.selected_robot is not None:
+                robot = self.fleet_manager.robots.get(self.selected_robot)
+                if robot:
+                    # Check if this is a charging station and robot needs charging
+                    if self._vertex_is_charger[vertex_index]:
+                        if robot.status != robot.STATUS_CHARGING:
                             success = self.fleet_manager.assign_task(self.selected_robot, vertex_index)
                             if success:
-                                messagebox.showinfo("Task Assigned", 
-                                                  f"Robot {self.selected_robot} assigned to navigate to {self.nav_graph.get_vertex_name(vertex_index)}")
+                                self.show_toast(f"Robot {self.selected_robot} assigned to navigate to charging station at {self._vertex_name[vertex_index]}")
                             else:
-                                messagebox.showwarning("Task Assignment Failed", 
-                                                     f"Could not assign Robot {self.selected_robot} to navigate to {self.nav_graph.get_vertex_name(vertex_index)}")
-                        self.clear_selection()
-                else:
-                    # Spawn a new robot
-                    robot = self.fleet_manager.spawn_robot(vertex_index)
-                    if robot:
-                        messagebox.showinfo("Robot Spawned", 
-                                          f"Robot {robot.id} spawned at {self.nav_graph.get_vertex_name(vertex_index)}")
-                    
-                self.update_gui()
-                return
+                                self.show_toast(f"Could not assign Robot {self.selected_robot} to navigate to charging station at {self._vertex_name[vertex_index]}", warning=True)
+                    else:
+                        # Regular navigation task
+                        success = self.fleet_manager.assign_task(self.selected_robot, vertex_index)
+                        if success:
+                            self.show_toast(f"Robot {self.selected_robot} assigned to navigate to {self._vertex_name[vertex_index]}")
+                        else:
+                            self.show_toast(f"Could not assign Robot {self.selected_robot} to navigate to {self._vertex_name[vertex_index]}", warning=True)
+                    self.clear_selection()
+            else:
+                # Spawn a new robot
+                robot = self.fleet_manager.spawn_robot(vertex_index)
+                if robot:
+                    self.show_toast(f"Robot {robot.id} spawned at {self._vertex_name[vertex_index]}")
+                
+            self.request_redraw()
+    
+    def show_toast(self, text, warning=False):
+        """Show a feedback message in the side panel for a few seconds"""
+        self.toast.config(text=text, foreground="#CC0000" if warning else "#006600")
+        if self._toast_job is not None:
+            self.root.after_cancel(self._toast_job)
+        self._toast_job = self.root.after(self.TOAST_DURATION_MS, self.clear_toast)
+    
+    def clear_toast(self):
+        """Hide the feedback message"""
+        self._toast_job = None
+        self.toast.config(text="")
     
     def clear_selection(self):
         """Clear the current selection"""
         self.selected_robot = None
-        self.update_gui()
+        self.request_redraw()
     
     def charge_selected_robot(self):
         """Start charging the selected robot if at a charging station"""
         if self.selected_robot is not None:
             robot = self.fleet_manager.robots.get(self.selected_robot)
             if robot:
-                if self.nav_graph.is_charger(robot.current_vertex):
+                if self._vertex_is_charger[robot.current_vertex]:
                     # Start charging
                     if robot.status != robot.STATUS_CHARGING:
-                        robot.status = robot.STATUS_CHARGING
+                        robot.set_status(robot.STATUS_CHARGING)
                         robot.charging_start_time = None  # Will be set in update
                         self.logger.info(f"Robot {robot.id} started charging")
-                        messagebox.showinfo("Charging Started", 
-                                          f"Robot {robot.id} charging at {self.nav_graph.get_vertex_name(robot.current_vertex)}")
+                        self.show_toast(f"Robot {robot.id} charging at {self._vertex_name[robot.current_vertex]}")
                 else:
-                    messagebox.showwarning("Cannot Charge", 
-                                         f"Robot {robot.id} is not at a charging station")
+                    self.show_toast(f"Robot {robot.id} is not at a charging station", warning=True)
         else:
-            messagebox.showinfo("No Robot Selected", "Please select a robot first")
+            self.show_toast("Please select a robot first")
     
     def stop(self):
         """Stop the update loop"""
         self.running = False
-        if self.update_thread.is_alive():
-            self.update_thread.join(timeout=1.0)
\ No newline at end of file
+        if self._tick_job is not None:
+            self.root.after_cancel(self._tick_job)
+            self._tick_job = None
\ No newline at end of file
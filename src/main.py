@@ -12,20 +12,25 @@ from src.controllers.fleet_manager import FleetManager
 from src.gui.fleet_gui import FleetGUI
 from src.utils.helpers import setup_logging
 
+# Nav graphs shipped with the project, relative to this file so it runs from any directory
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
+
 def main():
     # Set up logging
-    logger = setup_logging()
+    logger, log_listener = setup_logging()
     logger.info("Fleet Management System starting up")
     
     # Load nav_graph
     try:
-        nav_graph_path = "D:\\full stack\\goat\\data\\nav_graph_2.json"
+        # The NAV_GRAPH environment variable selects another nav_graph file
+        nav_graph_path = os.environ.get("NAV_GRAPH", os.path.join(DATA_DIR, "nav_graph_2.json"))
         logger.info(f"Loading navigation graph from {nav_graph_path}")
         nav_graph = NavigationGraph(nav_graph_path)
         logger.info(f"Loaded {len(nav_graph.vertices)} vertices and {len(nav_graph.lanes)} lanes")
     except Exception as e:
         logger.error(f"Failed to load navigation graph: {e}")
         messagebox.showerror("Error", f"Failed to load navigation graph: {e}")
+        log_listener.stop()
         return
     
     # Create controllers
@@ -41,6 +46,7 @@ def main():
         logger.info("Shutting down Fleet Management System")
         gui.stop()
         root.destroy()
+        log_listener.stop()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
     
@@ -1,64 +1,311 @@
 import json
+from collections import OrderedDict
+
+# orjson parses large graph files faster, the standard json module is used
+# when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Packed avoided lanes of a search that avoids nothing, shared by all of them
+_NO_LANES = frozenset()
 
 class NavigationGraph:
+    PATH_CACHE_SIZE = 256  # Searches remembered by find_path
+    
     def __init__(self, json_file_path):
         self.vertices = []
         self.lanes = []
         self.vertex_map = {}  # Maps vertex index to its data
+        # The same vertex data as parallel lists indexed by vertex, read by the accessors
+        self.vertex_coords = []  # (x, y) of each vertex
+        self.vertex_names = []  # Display name of each vertex, "V<index>" if it has none
+        self.charger_flags = bytearray()  # 1 for charging stations
+        self.charger_vertices = ()  # Indices of the charging stations
+        # The neighbors of each vertex as one tuple per vertex, built once since
+        # lanes never change, so searches and get_connected_vertices don't slice
+        self.neighbors = []
+        self.num_vertices = 0  # Vertex indices are 0 .. num_vertices - 1
+        # Recent find_path results, least recently used first
+        self._path_cache = OrderedDict()  # Format: {(start, destination, avoid_keys): path tuple}
+        # Hop counts to each destination searched so far, -1 where it can't be reached
+        self._distance_cache = {}  # Format: {destination: list of distances by vertex}
         self.load_from_json(json_file_path)
         
     def load_from_json(self, json_file_path):
-        try:
+        if orjson is not None:
+            with open(json_file_path, 'rb') as file:
+                data = orjson.loads(file.read())
+        else:
             with open(json_file_path, 'r') as file:
                 data = json.load(file)
-                
-            # Extract the first level found
-            level_key = list(data["levels"].keys())[0]
-            level_data = data["levels"][level_key]
-            
-            # Process vertices
-            self.vertices = level_data["vertices"]
             
-            # Create a mapping for easy lookup
-            for i, vertex in enumerate(self.vertices):
-                self.vertex_map[i] = {
-                    "coords": (vertex[0], vertex[1]),
-                    "name": vertex[2].get("name", f"V{i}"),
-                    "is_charger": vertex[2].get("is_charger", False)
-                }
-            
-            # Process lanes
-            self.lanes = level_data["lanes"]
-            
-        except Exception as e:
-            print(f"Error loading nav_graph: {e}")
-            raise
+        # Extract the first level found
+        level_key = list(data["levels"].keys())[0]
+        level_data = data["levels"][level_key]
+        
+        # Process vertices
+        self.vertices = level_data["vertices"]
+        
+        # Create a mapping for easy lookup
+        for i, vertex in enumerate(self.vertices):
+            self.vertex_map[i] = {
+                "coords": (vertex[0], vertex[1]),
+                "name": vertex[2].get("name", f"V{i}"),
+                "is_charger": vertex[2].get("is_charger", False)
+            }
+        vertex_data = [self.vertex_map[i] for i in range(len(self.vertices))]
+        self.vertex_coords = [data["coords"] for data in vertex_data]
+        self.vertex_names = [data["name"] or f"V{i}" for i, data in enumerate(vertex_data)]
+        self.charger_flags = bytearray(1 if data["is_charger"] else 0 for data in vertex_data)
+        self.charger_vertices = tuple(i for i, flag in enumerate(self.charger_flags) if flag)
+        
+        # Process lanes, keeping only their (from, to) vertices
+        self.lanes = tuple((lane[0], lane[1]) for lane in level_data["lanes"])
+        self.build_adjacency()
+    
+    def build_adjacency(self):
+        """Bucket the lanes by vertex once, so neighbor lookups don't scan every lane"""
+        vertex_count = len(self.vertices)
+        for from_vertex, to_vertex in self.lanes:
+            vertex_count = max(vertex_count, from_vertex + 1, to_vertex + 1)
+        
+        # Lay the neighbors out in CSR form: vertex v's are adjacency[start[v]:start[v + 1]]
+        start = [0] * (vertex_count + 1)
+        for from_vertex, to_vertex in self.lanes:
+            start[from_vertex + 1] += 1
+            start[to_vertex + 1] += 1
+        for i in range(vertex_count):
+            start[i + 1] += start[i]
+        
+        # Fill in lane order, so each vertex lists its neighbors in the order
+        # a scan of the lanes finds them
+        adjacency = [0] * start[vertex_count]
+        cursor = start[:vertex_count]
+        for from_vertex, to_vertex in self.lanes:
+            adjacency[cursor[from_vertex]] = to_vertex
+            cursor[from_vertex] += 1
+            adjacency[cursor[to_vertex]] = from_vertex
+            cursor[to_vertex] += 1
+        
+        self.neighbors = [tuple(adjacency[start[v]:start[v + 1]]) for v in range(vertex_count)]
+        self.num_vertices = vertex_count
+        self._path_cache.clear()
+        self._distance_cache.clear()
     
     def get_vertex_coords(self, vertex_index):
-        if vertex_index in self.vertex_map:
-            return self.vertex_map[vertex_index]["coords"]
+        if 0 <= vertex_index < len(self.vertex_coords):
+            return self.vertex_coords[vertex_index]
         return None
     
     def get_vertex_name(self, vertex_index):
-        if vertex_index in self.vertex_map:
-            return self.vertex_map[vertex_index]["name"] or f"V{vertex_index}"
+        if 0 <= vertex_index < len(self.vertex_names):
+            return self.vertex_names[vertex_index]
         return f"V{vertex_index}"
     
     def is_charger(self, vertex_index):
-        if vertex_index in self.vertex_map:
-            return self.vertex_map[vertex_index]["is_charger"]
+        if 0 <= vertex_index < len(self.charger_flags):
+            return self.charger_flags[vertex_index] == 1
         return False
     
+    def chargers(self):
+        """Returns the indices of the charging stations"""
+        return self.charger_vertices
+    
     def get_connected_vertices(self, vertex_index):
-        """Returns a list of vertex indices that can be reached from the given vertex"""
-        connected = []
-        for lane in self.lanes:
-            # Check for both directions
-            if lane[0] == vertex_index:
-                connected.append(lane[1])
-
-            if lane[1] == vertex_index:
-                connected.append(lane[0])
+        """Returns the vertex indices that can be reached from the given vertex"""
+        # Lanes are listed for both of their vertices, so they connect both ways
+        if not 0 <= vertex_index < self.num_vertices:
+            return ()
+        return self.neighbors[vertex_index]
+    
+    def find_path(self, start_vertex, destination_vertex, avoid_lanes=()):
+        """Returns the shortest path (start excluded) as a tuple, or () if there is none, without taking avoid_lanes"""
+        if start_vertex == destination_vertex:
+            return ()
+        
+        vertex_count = self.num_vertices
+        
+        # Pack avoided lanes in the graph as vertex * vertex_count + next_vertex
+        if avoid_lanes:
+            avoid_keys = frozenset(from_vertex * vertex_count + to_vertex for from_vertex, to_vertex in avoid_lanes
+                                   if 0 <= from_vertex < vertex_count and 0 <= to_vertex < vertex_count)
+        else:
+            avoid_keys = _NO_LANES
+        
+        # A destination next to the start is one lane away unless that lane is avoided
+        if (0 <= start_vertex < vertex_count and destination_vertex in self.neighbors[start_vertex]
+                and start_vertex * vertex_count + destination_vertex not in avoid_keys):
+            return (destination_vertex,)
+        
+        # The graph never changes, so a search can be answered from the cache
+        cache_key = (start_vertex, destination_vertex, avoid_keys)
+        path = self._path_cache.get(cache_key)
+        if path is not None:
+            self._path_cache.move_to_end(cache_key)
+            return path
+        
+        path = self._bfs(start_vertex, destination_vertex, avoid_keys)
+        self._path_cache[cache_key] = path
+        if len(self._path_cache) > self.PATH_CACHE_SIZE:
+            self._path_cache.popitem(last=False)
+        return path
+    
+    def distances_to(self, destination_vertex):
+        """Returns the number of lanes from every vertex to the destination, -1 where it can't be reached"""
+        distances = self._distance_cache.get(destination_vertex)
+        if distances is not None:
+            return distances
+        
+        # Lanes connect both ways, so this is a plain BFS out of the destination
+        neighbors = self.neighbors
+        distances = [-1] * self.num_vertices
+        distances[destination_vertex] = 0
+        queue = [destination_vertex]
+        for vertex in queue:
+            next_distance = distances[vertex] + 1
+            for next_vertex in neighbors[vertex]:
+                if distances[next_vertex] < 0:
+                    distances[next_vertex] = next_distance
+                    queue.append(next_vertex)
+        
+        self._distance_cache[destination_vertex] = distances
+        return distances
+    
+    def _bfs(self, start_vertex, destination_vertex, avoid_keys):
+        """Breadth-first search for find_path"""
+        vertex_count = self.num_vertices
+        if not (0 <= start_vertex < vertex_count and 0 <= destination_vertex < vertex_count):
+            return ()
+        
+        # Only search vertices one lane closer to the destination than their parent
+        if avoid_keys:
+            distances = self._shortest_path_distances(start_vertex, destination_vertex, avoid_keys)
+            if distances is None:
+                return ()
+        else:
+            distances = self.distances_to(destination_vertex)
+            if distances[start_vertex] < 0:
+                return ()
+        
+        # Vertex indices are dense, so these are indexed by vertex rather than hashed
+        visited = bytearray(vertex_count)
+        visited[start_vertex] = 1
+        parent = [0] * vertex_count
+        
+        # The queue is a list the for loop walks while it grows
+        neighbors = self.neighbors
+        queue = [start_vertex]
+        
+        # Nothing is avoided in the common case, which gets its own loop
+        # without any lane checks
+        if not avoid_keys:
+            for vertex in queue:
+                closer_distance = distances[vertex] - 1
+                for next_vertex in neighbors[vertex]:
+                    # Only the destination is at distance 0 and it is never marked visited
+                    if visited[next_vertex] or distances[next_vertex] != closer_distance:
+                        continue
+                    if next_vertex == destination_vertex:
+                        return self._rebuild_path(parent, start_vertex, vertex, next_vertex)
+                    visited[next_vertex] = 1
+                    parent[next_vertex] = vertex
+                    queue.append(next_vertex)
+            return ()
+        
+        for vertex in queue:
+            # Check all connected vertices
+            connected = neighbors[vertex]
+            lane_key_base = vertex * vertex_count
+            closer_distance = distances[vertex] - 1
+            
+            for next_vertex in connected:
+                # The cheapest checks come first, as above
+                if visited[next_vertex] or distances[next_vertex] != closer_distance:
+                    continue
+                
+                # Skip avoided lanes
+                if lane_key_base + next_vertex in avoid_keys:
+                    continue
+                    
+                if next_vertex == destination_vertex:
+                    return self._rebuild_path(parent, start_vertex, vertex, next_vertex)
+                
+                visited[next_vertex] = 1
+                parent[next_vertex] = vertex
+                queue.append(next_vertex)
+        
+        return ()
+    
+    @staticmethod
+    def _rebuild_path(parent, start_vertex, vertex, destination_vertex):
+        """Walk back from vertex, next to the destination, to the start (which is not part of the path)"""
+        path = [destination_vertex]
+        while vertex != start_vertex:
+            path.append(vertex)
+            vertex = parent[vertex]
+        path.reverse()
+        return tuple(path)
+    
+    def _shortest_path_distances(self, start_vertex, destination_vertex, avoid_keys):
+        """Returns the number of lanes to the destination for the vertices on shortest paths from the start
+        (-1 for the others), or None if there is no path, searching from both ends at once"""
+        vertex_count = self.num_vertices
+        neighbors = self.neighbors
+        
+        # Grow the side with the smaller frontier by a whole level until they meet
+        forward_depth = [-1] * vertex_count
+        backward_depth = [-1] * vertex_count
+        forward_depth[start_vertex] = 0
+        backward_depth[destination_vertex] = 0
+        forward_levels = [[start_vertex]]
+        backward_levels = [[destination_vertex]]
+        length = -1  # Lanes on a shortest path, once the searches meet
+        while length < 0:
+            forward_frontier = forward_levels[-1]
+            backward_frontier = backward_levels[-1]
+            if not forward_frontier or not backward_frontier:
+                return None
+            
+            level = []
+            if len(forward_frontier) <= len(backward_frontier):
+                depth = len(forward_levels)
+                for vertex in forward_frontier:
+                    lane_key_base = vertex * vertex_count
+                    for next_vertex in neighbors[vertex]:
+                        if forward_depth[next_vertex] < 0 and lane_key_base + next_vertex not in avoid_keys:
+                            forward_depth[next_vertex] = depth
+                            level.append(next_vertex)
+                            if backward_depth[next_vertex] >= 0 and (length < 0 or depth + backward_depth[next_vertex] < length):
+                                length = depth + backward_depth[next_vertex]
+                forward_levels.append(level)
+            else:
+                depth = len(backward_levels)
+                for vertex in backward_frontier:
+                    for previous_vertex in neighbors[vertex]:
+                        if backward_depth[previous_vertex] < 0 and previous_vertex * vertex_count + vertex not in avoid_keys:
+                            backward_depth[previous_vertex] = depth
+                            level.append(previous_vertex)
+                            if forward_depth[previous_vertex] >= 0 and (length < 0 or depth + forward_depth[previous_vertex] < length):
+                                length = depth + forward_depth[previous_vertex]
+                backward_levels.append(level)
+        
+        # From this forward depth on, the backward depths are exact distances
+        distances = backward_depth
+        first_exact_depth = length - (len(backward_levels) - 1)
         
-        #self.logger.info(f"Vertex {vertex_index} is connected to: {connected}")
-        return connected
\ No newline at end of file
+        # Closer to the start, a vertex is on a shortest path if a lane leads
+        # from it to one on a shortest path one level further out
+        for depth in range(first_exact_depth - 1, -1, -1):
+            next_distance = length - depth - 1
+            for vertex in forward_levels[depth]:
+                if distances[vertex] >= 0:
+                    continue
+                lane_key_base = vertex * vertex_count
+                for next_vertex in neighbors[vertex]:
+                    if (forward_depth[next_vertex] == depth + 1 and distances[next_vertex] == next_distance
+                            and lane_key_base + next_vertex not in avoid_keys):
+                        distances[vertex] = next_distance + 1
+                        break
+        return distances
@@ -1,28 +1,57 @@
+import sys
 import time
 import math
 import logging
+from collections import deque
+
+# Robot statuses, also bound at module level so the per-tick checks in
+# update() are plain global lookups
+_IDLE = "idle"
+_MOVING = "moving"
+_WAITING = "waiting"
+_CHARGING = "charging"
+_COMPLETED = "task_complete"
+_BLOCKED = "blocked"
+
+# UI text of the statuses that don't depend on the robot's state
+_STATUS_TEXT = {
+    _IDLE: "Idle",
+    _MOVING: "Moving",
+    _BLOCKED: "Blocked - No Alternative",
+    _COMPLETED: "Task Complete",
+}
+
+# Robot colors, picked by ID. Built and interned once here instead of a new
+# list per robot, so robots of the same color share one string
+_COLORS = tuple(sys.intern(color) for color in (
+    "#FF5733", "#33FF57", "#3357FF", "#F033FF", "#FF33F0",
+    "#33FFF0", "#F0FF33", "#5733FF", "#FF3357", "#57FF33"))
 
 class Robot:
-    STATUS_IDLE = "idle"
-    STATUS_MOVING = "moving"
-    STATUS_WAITING = "waiting"
-    STATUS_CHARGING = "charging"
-    STATUS_COMPLETED = "task_complete"
-    STATUS_BLOCKED = "blocked"  # New status for when no alternative path exists
+    STATUS_IDLE = _IDLE
+    STATUS_MOVING = _MOVING
+    STATUS_WAITING = _WAITING
+    STATUS_CHARGING = _CHARGING
+    STATUS_COMPLETED = _COMPLETED
+    STATUS_BLOCKED = _BLOCKED  # New status for when no alternative path exists
+    LOG_ACTIONS = False  # Robot actions are not logged, set to True to trace them
     
-    def __init__(self, robot_id, current_vertex, nav_graph, logger=None):
+    def __init__(self, robot_id, current_vertex, nav_graph, logger=None, on_status_change=None,
+                 on_vertex_change=None):
         self.id = robot_id
         self.current_vertex = current_vertex
         self.destination_vertex = None
-        self.path = []  # List of vertex indices to traverse
-        self.original_path = []  # Store original path for reference
+        self.path = deque()  # Vertex indices to traverse, popped from the front as they are reached
+        self.original_path = ()  # Store original path for reference, read-only so kept as a tuple
         self.current_lane = None  # (from_vertex, to_vertex)
         self.status = self.STATUS_IDLE
         self.nav_graph = nav_graph
         self.progress = 0.0  # Progress along current lane (0.0 to 1.0)
         self.color = self.generate_color()
         self.logger = logger or logging.getLogger(__name__)
+        self._log_enabled = self.LOG_ACTIONS and self.logger.isEnabledFor(logging.INFO)
         self.movement_start_time = None
+        self.movement_end_time = None  # When the current move is due to finish
         self.movement_total_time = 2.0  # Seconds to traverse a lane
 
         self.charging_start_time = None
@@ -34,24 +63,57 @@ class Robot:
         self.path_recalculation_attempts = 0
         self.max_recalculation_attempts = 3  # Limit recalculation attempts
         
+        # Vertex the robot last registered at, and the traffic manager's
+        # vertex_occupancy_changes right after it did
+        self._registered_vertex = None
+        self._registered_changes = -1
+        
         # Waiting reason tracking
         self.waiting_for_lane = False
         self.waiting_for_vertex = False
         
+        # Called as on_status_change(robot, old_status, new_status)
+        self.on_status_change = on_status_change
+        # Called as on_vertex_change(robot, old_vertex, new_vertex)
+        self.on_vertex_change = on_vertex_change
+        
         # Register the robot at its current vertex
-        self.log(f"Robot {self.id} spawned at {self.nav_graph.get_vertex_name(self.current_vertex)}")
+        if self._log_enabled:
+            self.log("Robot %s spawned at %s", self.id, self.nav_graph.get_vertex_name(self.current_vertex))
     
     def generate_color(self):
         #Generate a unique color for the robot
         # Simple color generation based on ID
-        colors = ["#FF5733", "#33FF57", "#3357FF", "#F033FF", "#FF33F0", 
-                 "#33FFF0", "#F0FF33", "#5733FF", "#FF3357", "#57FF33"]
-        return colors[self.id % len(colors)]
+        return _COLORS[self.id % len(_COLORS)]
+    
+    def set_status(self, status):
+        #Change status and notify the listener if it actually changed
+        old_status = self.status
+        if old_status == status:
+            return
+        self.status = status
+        if self.on_status_change:
+            self.on_status_change(self, old_status, status)
+    
+    def set_current_vertex(self, vertex):
+        #Move the robot to a vertex and notify the listener
+        old_vertex = self.current_vertex
+        self.current_vertex = vertex
+        if self.on_vertex_change and old_vertex != vertex:
+            self.on_vertex_change(self, old_vertex, vertex)
+    
+    def is_parked(self):
+        #A parked robot has nothing to do until it gets a new task or status
+        status = self.status
+        if status == _BLOCKED:
+            return True
+        return not self.path and (status == _IDLE or status == _COMPLETED)
     
     def set_destination(self, destination_vertex):
         #Set the destination and calculate path
         self.destination_vertex = destination_vertex
-        self.log(f"Robot {self.id} assigned to navigate to {self.nav_graph.get_vertex_name(destination_vertex)}")
+        if self._log_enabled:
+            self.log("Robot %s assigned to navigate to %s", self.id, self.nav_graph.get_vertex_name(destination_vertex))
         
         # Reset path tracking variables
         self.blocked_lanes = set()
@@ -61,213 +123,242 @@ class Robot:
         self.calculate_path()
         
         if self.path:
-            self.original_path = self.path.copy()  # Store original path
-            self.status = self.STATUS_IDLE  # Will start moving in update
+            self.original_path = tuple(self.path)  # Store original path
+            self.set_status(self.STATUS_IDLE)  # Will start moving in update
             return True
         else:
-            self.log(f"Robot {self.id} could not find path to {self.nav_graph.get_vertex_name(destination_vertex)}")
+            if self._log_enabled:
+                self.log("Robot %s could not find path to %s", self.id, self.nav_graph.get_vertex_name(destination_vertex))
             return False
     
 
     def calculate_path(self, avoid_lanes=None):
         #Calculate path using BFS with option to avoid certain lanes
         if self.current_vertex == self.destination_vertex:
-            self.log(f"Robot {self.id} is already at destination vertex {self.destination_vertex}")
-            self.path = []
+            self.log("Robot %s is already at destination vertex %s", self.id, self.destination_vertex)
+            self.path = deque()
             return
         
         if avoid_lanes is None:
             avoid_lanes = self.blocked_lanes
         
-        queue = [(self.current_vertex, [])]
-        visited = set([self.current_vertex])
+        # A path to the same destination that uses none of the avoided lanes
+        # is still valid, so there is nothing to search for
+        if self.path and self.path[-1] == self.destination_vertex and not self.path_uses_lanes(avoid_lanes):
+            self.log("Robot %s keeps its path to %s", self.id, self.destination_vertex)
+            return
         
-        self.log(f"Robot {self.id} calculating path from {self.current_vertex} to {self.destination_vertex}")
-        self.log(f"Avoiding lanes: {avoid_lanes}")
+        self.log("Robot %s calculating path from %s to %s", self.id, self.current_vertex, self.destination_vertex)
+        self.log("Avoiding lanes: %s", avoid_lanes)
         
-        while queue:
-            vertex, path = queue.pop(0)
-            
-            # Check all connected vertices
-            connected = self.nav_graph.get_connected_vertices(vertex)
-            
-            for next_vertex in connected:
-                # Skip edges in the avoid_lanes set
-                if (vertex, next_vertex) in avoid_lanes:
-                    continue
-                    
-                if next_vertex == self.destination_vertex:
-                    # Path found
-                    final_path = path + [next_vertex]
-                    self.path = final_path
-                    self.log(f"Path found: {self.path}")
-                    return
-                
-                if next_vertex not in visited:
-                    visited.add(next_vertex)
-                    queue.append((next_vertex, path + [next_vertex]))
+        # The nav_graph caches searches, the path is copied since the robot
+        # consumes it as it moves
+        path = self.nav_graph.find_path(self.current_vertex, self.destination_vertex, avoid_lanes)
+        if path:
+            self.path = deque(path)
+            if self._log_enabled:
+                self.log("Path found: %s", list(path))
+            return
         
         # No path found
-        self.log(f"No path found from {self.current_vertex} to {self.destination_vertex} (avoiding {len(avoid_lanes)} lanes)")
-        self.path = []
+        self.log("No path found from %s to %s (avoiding %s lanes)", self.current_vertex, self.destination_vertex, len(avoid_lanes))
+        self.path = deque()
+    
+    def path_uses_lanes(self, lanes):
+        #Check if any lane of the remaining path, which starts at the current vertex, is in lanes
+        if not lanes:
+            return False
+        from_vertex = self.current_vertex
+        for to_vertex in self.path:
+            if (from_vertex, to_vertex) in lanes:
+                return True
+            from_vertex = to_vertex
+        return False
     
-    def start_move_to_next_vertex(self, traffic_manager):
-        #Attempt to start moving to the next vertex in the path
+    def register_vertex(self, traffic_manager):
+        #Mark the current vertex as occupied by this robot and remember when
+        traffic_manager.occupy_vertex(self.id, self.current_vertex)
+        self._registered_vertex = self.current_vertex
+        self._registered_changes = traffic_manager.vertex_occupancy_changes
+    
+    def start_move_to_next_vertex(self, traffic_manager, now=None):
+        #Attempt to start moving to the next vertex in the path, now is the current time.monotonic() if known
         if not self.path:
             # No path or already at destination
             if self.current_vertex == self.destination_vertex:
-                self.status = self.STATUS_COMPLETED
-                self.log(f"Robot {self.id} completed navigation to {self.nav_graph.get_vertex_name(self.destination_vertex)}")
+                self.set_status(self.STATUS_COMPLETED)
+                if self._log_enabled:
+                    self.log("Robot %s completed navigation to %s", self.id, self.nav_graph.get_vertex_name(self.destination_vertex))
             return False
         
         next_vertex = self.path[0]
         
         # First check if the destination vertex is already occupied
         if traffic_manager.is_vertex_occupied(next_vertex, self.id):
-            self.status = self.STATUS_WAITING
+            self.set_status(self.STATUS_WAITING)
             self.waiting_for_vertex = True
             self.waiting_for_lane = False
-            occupying_robot = traffic_manager.get_vertex_occupying_robot(next_vertex)
-            self.log(f"Robot {self.id} waiting for vertex {self.nav_graph.get_vertex_name(next_vertex)} - occupied by Robot {occupying_robot}")
+            if self._log_enabled:
+                occupying_robot = traffic_manager.get_vertex_occupying_robot(next_vertex)
+                self.log("Robot %s waiting for vertex %s - occupied by Robot %s", self.id, self.nav_graph.get_vertex_name(next_vertex), occupying_robot)
             return False
         
         # Then request lane access
         if traffic_manager.request_lane_access(self, self.current_vertex, next_vertex):
             # Mark lane as occupied and begin movement
             self.current_lane = (self.current_vertex, next_vertex)
-            self.status = self.STATUS_MOVING
+            self.set_status(self.STATUS_MOVING)
             self.progress = 0.0
-            self.movement_start_time = time.time()
+            self.movement_start_time = now if now is not None else time.monotonic()
+            self.movement_end_time = self.movement_start_time + self.movement_total_time
             self.waiting_for_lane = False
             self.waiting_for_vertex = False
-            self.log(f"Robot {self.id} moving from {self.nav_graph.get_vertex_name(self.current_vertex)} to {self.nav_graph.get_vertex_name(next_vertex)}")
+            if self._log_enabled:
+                self.log("Robot %s moving from %s to %s", self.id, self.nav_graph.get_vertex_name(self.current_vertex), self.nav_graph.get_vertex_name(next_vertex))
             return True
         else:
             # Either lane or vertex is blocked
-            self.status = self.STATUS_WAITING
+            self.set_status(self.STATUS_WAITING)
             # Check specifically if it's the lane that's blocked
             if traffic_manager.is_lane_occupied(self.current_vertex, next_vertex):
                 self.waiting_for_lane = True
                 self.waiting_for_vertex = False
-                occupying_robot = traffic_manager.get_occupying_robot(self.current_vertex, next_vertex)
-                self.log(f"Robot {self.id} waiting for lane access from {self.nav_graph.get_vertex_name(self.current_vertex)} to {self.nav_graph.get_vertex_name(next_vertex)} - blocked by Robot {occupying_robot}")
+                if self._log_enabled:
+                    occupying_robot = traffic_manager.get_occupying_robot(self.current_vertex, next_vertex)
+                    self.log("Robot %s waiting for lane access from %s to %s - blocked by Robot %s", self.id, self.nav_graph.get_vertex_name(self.current_vertex), self.nav_graph.get_vertex_name(next_vertex), occupying_robot)
             return False
         
-    def update(self, traffic_manager, dt=None):
-        """Update robot state"""
-        # Register the robot's position with the traffic manager
-        traffic_manager.occupy_vertex(self.id, self.current_vertex)
+    def update(self, traffic_manager, dt=None, now=None):
+        """Update robot state, now is the time.monotonic() of this tick shared by all robots"""
+        if now is None:
+            now = time.monotonic()
         
-        # Handle charging state
-        if self.status == self.STATUS_CHARGING:
-            # If this is a new charging session, record start time
-            if self.charging_start_time is None:
-                self.charging_start_time = time.time()
-                self.charging_progress = 0.0
-                self.log(f"Robot {self.id} started charging at {self.nav_graph.get_vertex_name(self.current_vertex)}")
-            
-            # Update charging progress
-            if dt is None:
-                # Calculate time-based progress
-                current_time = time.time()
-                elapsed = current_time - self.charging_start_time
-                self.charging_progress = min(1.0, elapsed / self.charging_total_time)
-            else:
-                # Use provided dt (for fixed time step)
-                self.charging_progress += dt / self.charging_total_time
-                self.charging_progress = min(1.0, self.charging_progress)
+        # Register the robot's position unless it still holds its registered vertex
+        if (self._registered_vertex != self.current_vertex
+                or self._registered_changes != traffic_manager.vertex_occupancy_changes):
+            self.register_vertex(traffic_manager)
+        
+        # Only the statuses that have something to do have a handler, a
+        # blocked robot stays blocked until user intervention
+        handler = self._STATUS_HANDLERS.get(self.status)
+        if handler is not None:
+            handler(self, traffic_manager, dt, now)
+    
+    def _update_charging(self, traffic_manager, dt, now):
+        #Charge, then go back to idle when done
+        # If this is a new charging session, record start time
+        if self.charging_start_time is None:
+            self.charging_start_time = now
+            self.charging_progress = 0.0
+            if self._log_enabled:
+                self.log("Robot %s started charging at %s", self.id, self.nav_graph.get_vertex_name(self.current_vertex))
+        
+        # Update charging progress
+        if dt is None:
+            # Calculate time-based progress
+            elapsed = now - self.charging_start_time
+            self.charging_progress = min(1.0, elapsed / self.charging_total_time)
+        else:
+            # Use provided dt (for fixed time step), clamped without a min() call
+            charging_progress = self.charging_progress + dt / self.charging_total_time
+            self.charging_progress = 1.0 if charging_progress >= 1.0 else charging_progress
 
-            # If charging is complete, change to idle status
-            if self.charging_progress >= 1.0:
-                self.status = self.STATUS_IDLE
-                self.charging_start_time = None
-                self.charging_progress = 0.0
-                self.log(f"Robot {self.id} finished charging at {self.nav_graph.get_vertex_name(self.current_vertex)}")
-            
-            # If the robot has a path (assigned during charging), don't exit yet, wait until charging is done
+        # If charging is complete, change to idle status
+        if self.charging_progress >= 1.0:
+            self.set_status(self.STATUS_IDLE)
+            self.charging_start_time = None
+            self.charging_progress = 0.0
+            if self._log_enabled:
+                self.log("Robot %s finished charging at %s", self.id, self.nav_graph.get_vertex_name(self.current_vertex))
+    
+    def _update_waiting(self, traffic_manager, dt, now):
+        #Periodically check if the lane/vertex the robot waits for is now available
+        if not self.path:
             return
+        next_vertex = self.path[0]
         
-        # If blocked, stay blocked until user intervention
-        if self.status == self.STATUS_BLOCKED:
+        # Check if we're waiting for a vertex and if it's now free
+        if self.waiting_for_vertex and not traffic_manager.is_vertex_occupied(next_vertex, self.id):
+            self.waiting_for_vertex = False
+            self.log("Vertex %s is now free. Attempting to move.", next_vertex)
+            if self.start_move_to_next_vertex(traffic_manager, now):
+                self._update_moving(traffic_manager, dt, now)
             return
-        
-        # If waiting, periodically check if lane/vertex is now available
-        if self.status == self.STATUS_WAITING and self.path:
-            next_vertex = self.path[0]
             
-            # Check if we're waiting for a vertex and if it's now free
-            if self.waiting_for_vertex and not traffic_manager.is_vertex_occupied(next_vertex, self.id):
-                self.waiting_for_vertex = False
-                self.movement_start_time = None  # Reset timer
-                self.log(f"Vertex {next_vertex} is now free. Attempting to move.")
-                self.start_move_to_next_vertex(traffic_manager)
-                return
-                
-            # Check if we're waiting for a lane and if it's now free
-            if self.waiting_for_lane and not traffic_manager.is_lane_occupied(self.current_vertex, next_vertex):
-                self.waiting_for_lane = False
-                self.movement_start_time = None  # Reset timer
-                self.log(f"Lane from {self.current_vertex} to {next_vertex} is now free. Attempting to move.")
-                self.start_move_to_next_vertex(traffic_manager)
-                return
-                
-            # If we're waiting but haven't set a specific reason, check both
-            if not self.waiting_for_lane and not self.waiting_for_vertex:
-                if not traffic_manager.is_lane_occupied(self.current_vertex, next_vertex) and \
-                   not traffic_manager.is_vertex_occupied(next_vertex, self.id):
-                    self.movement_start_time = None  # Reset timer
-                    self.log(f"Path to {next_vertex} is now clear. Attempting to move.")
-                    self.start_move_to_next_vertex(traffic_manager)
-                else:
-                    # Initialize the waiting timer if not already set
-                    if self.movement_start_time is None:
-                        self.movement_start_time = time.time()
-                        self.log(f"Robot {self.id} waiting for path to {next_vertex} to become available")
-            return
-        
-        # If idle with a path, try to start moving
-        if self.status == self.STATUS_IDLE and self.path:
-            self.start_move_to_next_vertex(traffic_manager)
+        # Check if we're waiting for a lane and if it's now free
+        if self.waiting_for_lane and not traffic_manager.is_lane_occupied(self.current_vertex, next_vertex):
+            self.waiting_for_lane = False
+            self.log("Lane from %s to %s is now free. Attempting to move.", self.current_vertex, next_vertex)
+            if self.start_move_to_next_vertex(traffic_manager, now):
+                self._update_moving(traffic_manager, dt, now)
             return
-        
-        # If moving, update progress
-        if self.status == self.STATUS_MOVING:
-            if dt is None:
-                # Calculate time-based progress
-                current_time = time.time()
-                elapsed = current_time - self.movement_start_time
-                self.progress = min(1.0, elapsed / self.movement_total_time)
+            
+        # If we're waiting but haven't set a specific reason, check both
+        if not self.waiting_for_lane and not self.waiting_for_vertex:
+            if not traffic_manager.is_lane_occupied(self.current_vertex, next_vertex) and \
+               not traffic_manager.is_vertex_occupied(next_vertex, self.id):
+                self.log("Path to %s is now clear. Attempting to move.", next_vertex)
+                if self.start_move_to_next_vertex(traffic_manager, now):
+                    self._update_moving(traffic_manager, dt, now)
             else:
-                # Use provided dt (for fixed time step)
-                self.progress += dt / self.movement_total_time
-                self.progress = min(1.0, self.progress)
+                # Initialize the waiting timer if not already set
+                if self.movement_start_time is None:
+                    self.movement_start_time = now
+                    self.log("Robot %s waiting for path to %s to become available", self.id, next_vertex)
+    
+    def _update_idle(self, traffic_manager, dt, now):
+        #If idle with a path, try to start moving, a robot that starts makes progress in the same tick
+        if self.path and self.start_move_to_next_vertex(traffic_manager, now):
+            self._update_moving(traffic_manager, dt, now)
+    
+    def _update_moving(self, traffic_manager, dt, now):
+        #Update progress along the current lane and arrive at its end
+        if dt is None:
+            # Calculate time-based progress from the end time fixed when the move started
+            progress = 1.0 - (self.movement_end_time - now) / self.movement_total_time
+            self.progress = 1.0 if progress >= 1.0 else progress
+        else:
+            # Use provided dt (for fixed time step), clamped without a min() call
+            progress = self.progress + dt / self.movement_total_time
+            self.progress = 1.0 if progress >= 1.0 else progress
+        
+        # Check if movement is complete
+        if self.progress >= 1.0:
+            # Update position
+            from_vertex, to_vertex = self.current_lane
             
-            # Check if movement is complete
-            if self.progress >= 1.0:
-                # Update position
-                from_vertex, to_vertex = self.current_lane
-                
-                # Release the current vertex since we're leaving it
-                traffic_manager.release_vertex(self.current_vertex)
-                
-                # Release the lane and get the next robot to notify (if any)
-                success, next_robot_id = traffic_manager.release_lane(from_vertex, to_vertex)
-                
-                # Update our position
-                self.current_vertex = to_vertex
-                self.current_lane = None
-                self.path.pop(0)  # Remove the vertex we just reached
-                self.status = self.STATUS_IDLE
-                
-                # Register at the new vertex
-                traffic_manager.occupy_vertex(self.id, self.current_vertex)
-                
-                self.log(f"Robot {self.id} arrived at {self.nav_graph.get_vertex_name(self.current_vertex)}")
-                
-                # If at destination, mark as complete
-                if not self.path and self.current_vertex == self.destination_vertex:
-                    self.status = self.STATUS_COMPLETED
-                    self.log(f"Robot {self.id} completed navigation to {self.nav_graph.get_vertex_name(self.destination_vertex)}")
+            # Release the current vertex since we're leaving it
+            traffic_manager.release_vertex(self.current_vertex)
+            
+            # Release the lane and get the next robot to notify (if any)
+            success, next_robot_id = traffic_manager.release_lane(from_vertex, to_vertex)
+            
+            # Update our position
+            self.set_current_vertex(to_vertex)
+            self.current_lane = None
+            self.path.popleft()  # Remove the vertex we just reached
+            self.set_status(self.STATUS_IDLE)
+            
+            # Register at the new vertex
+            self.register_vertex(traffic_manager)
+            
+            if self._log_enabled:
+                self.log("Robot %s arrived at %s", self.id, self.nav_graph.get_vertex_name(self.current_vertex))
+            
+            # If at destination, mark as complete
+            if not self.path and self.current_vertex == self.destination_vertex:
+                self.set_status(self.STATUS_COMPLETED)
+                if self._log_enabled:
+                    self.log("Robot %s completed navigation to %s", self.id, self.nav_graph.get_vertex_name(self.destination_vertex))
+    
+    # Handler run by update() for each status, one dict lookup instead of a
+    # chain of status comparisons
+    _STATUS_HANDLERS = {
+        _CHARGING: _update_charging,
+        _WAITING: _update_waiting,
+        _IDLE: _update_idle,
+        _MOVING: _update_moving,
+    }
     
     def get_current_position(self):
         #Get current coordinates based on progress along lane
@@ -309,26 +400,20 @@ class Robot:
     
     def get_status_text(self):
         #Get detailed status text for UI display
-        if self.status == self.STATUS_WAITING:
+        status = self.status
+        if status == _WAITING:
             if self.waiting_for_vertex:
                 return "Waiting - Vertex Occupied"
             elif self.waiting_for_lane:
                 return "Waiting - Lane Blocked"
             else:
                 return "Waiting - Path Blocked"
-        elif self.status == self.STATUS_BLOCKED:
-            return "Blocked - No Alternative"
-        elif self.status == self.STATUS_IDLE:
-            return "Idle"
-        elif self.status == self.STATUS_MOVING:
-            return "Moving"
-        elif self.status == self.STATUS_CHARGING:
+        elif status == _CHARGING:
             return f"Charging - {int(self.charging_progress * 100)}%"
-        elif self.status == self.STATUS_COMPLETED:
-            return "Task Complete"
-        return self.status
+        # The other statuses have fixed text
+        return _STATUS_TEXT.get(status, status)
     
-    def log(self, message):
-        #Log robot action
-        if self.logger:
-            return
\ No newline at end of file
+    def log(self, message, *args):
+        #Log robot action, formatting the message only if it is logged
+        if self._log_enabled:
+            self.logger.info(message, *args)
\ No newline at end of file
@@ -1,9 +1,13 @@
 import os
+import math
+import queue
+import atexit
 import logging
 import datetime
+from logging.handlers import QueueHandler, QueueListener, MemoryHandler
 
 def setup_logging(log_dir="logs"):
-    """Set up logging to file and console"""
+    """Set up logging to file and console, returns the logger and its queue listener"""
     # Ensure log directory exists
     os.makedirs(log_dir, exist_ok=True)
     
@@ -28,13 +32,24 @@ def setup_logging(log_dir="logs"):
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # The handlers run on a background thread fed through a queue, so
+    # logging doesn't write on the simulation thread. File writes are
+    # batched, but warnings and errors are written out at once. The caller
+    # stops the listener on shutdown to drain the queue, and the file
+    # buffer is flushed at exit
+    log_queue = queue.SimpleQueue()
+    file_buffer = MemoryHandler(1024, flushLevel=logging.WARNING, target=file_handler)
+    listener = QueueListener(log_queue, file_buffer, console_handler)
+    listener.start()
+    atexit.register(file_buffer.close)
+    
+    # Add the queue handler to logger
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
     
     logger.info("Logging initialized")
-    return logger
+    return logger, listener
 
 def euclidean_distance(point1, point2):
     """Calculate Euclidean distance between two points"""
-    return ((point1[0] - point2[0]) ** 2 + (point1[1] - point2[1]) ** 2) ** 0.5
\ No newline at end of file
+    return math.hypot(point1[0] - point2[0], point1[1] - point2[1])
\ No newline at end of file